@@ -4,7 +4,7 @@ Cache utilities using Redis.
 
 import json
 import pickle
-from typing import Any, Optional, Union
+from typing import Any, List, Optional, Union
 from datetime import datetime, timedelta
 import logging
 
@@ -44,16 +44,42 @@ class CacheService:
             value = self.redis_client.get(key)
             if value is None:
                 return default
-
-            # Try to deserialize as JSON first, then pickle
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return pickle.loads(value)
+            return self._deserialize(value)
         except Exception as e:
             logger.error(f"Error getting cache key {key}: {e}")
             return default
 
+    def get_many(self, keys: List[str], default: Any = None) -> List[Any]:
+        """Get several values in one round trip (MGET), in key order."""
+        if not self.redis_client or not keys:
+            return [default] * len(keys)
+
+        try:
+            values = self.redis_client.mget(keys)
+        except Exception as e:
+            logger.error(f"Error getting {len(keys)} cache keys: {e}")
+            return [default] * len(keys)
+
+        results = []
+        for key, value in zip(keys, values):
+            if value is None:
+                results.append(default)
+                continue
+            try:
+                results.append(self._deserialize(value))
+            except Exception as e:
+                logger.error(f"Error getting cache key {key}: {e}")
+                results.append(default)
+        return results
+
+    @staticmethod
+    def _deserialize(value: bytes) -> Any:
+        """Decode a stored value, trying JSON first, then pickle."""
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return pickle.loads(value)
+
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """Set value in cache with TTL in seconds."""
         if not self.redis_client:
@@ -71,6 +97,22 @@ class CacheService:
             logger.error(f"Error setting cache key {key}: {e}")
             return False
 
+    def claim(self, key: str, ttl: int = 3600) -> bool:
+        """
+        Atomically claim key for ttl seconds (SET NX EX).
+
+        Returns False only when the key is already held; without Redis every
+        claim succeeds, so callers fall back to no de-duplication.
+        """
+        if not self.redis_client:
+            return True
+
+        try:
+            return bool(self.redis_client.set(key, "1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Error claiming cache key {key}: {e}")
+            return True
+
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
         if not self.redis_client:
@@ -22,6 +22,7 @@ class Settings(BaseSettings):
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 30
     DATABASE_POOL_TIMEOUT: int = 30
+    BULK_UPDATE_COPY_THRESHOLD: int = 500  # rows; smaller batches use executemany
 
     # Redis settings
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -59,6 +60,8 @@ class Settings(BaseSettings):
     EMAIL_USE_TLS: bool = True
     EMAIL_FROM: str = "noreply@shikshasetu.com"
     EMAIL_FROM_NAME: str = "ShikshaSetu"
+    EMAIL_BULK_BATCH_SIZE: int = 500  # messages per SMTP connection
+    EMAIL_SEND_CONCURRENCY: int = 10
 
     # SMS settings
     SMS_PROVIDER: str = "twilio"  # twilio, msg91, textlocal
@@ -75,13 +78,33 @@ class Settings(BaseSettings):
     SCRAPING_DELAY_SECONDS: int = 2
     SCRAPING_USER_AGENT: str = "ShikshaSetu-Bot/1.0"
     SCRAPING_RESPECT_ROBOTS_TXT: bool = True
+    SCRAPING_SAVE_BATCH_SIZE: int = 500
+    # Kept below SCRAPING_FUZZY_DEDUP_MAX_BATCH so streamed saves get fuzzy dedup
+    SCRAPING_STREAM_BATCH_SIZE: int = 40
+    SCRAPING_FUZZY_DEDUP_MAX_BATCH: int = 50
+    CRAWLER_MAX_CONCURRENT_PAGES: int = 8
+    CRAWLER_REQUESTS_PER_PERIOD: int = 2  # per domain
+    CRAWLER_RATE_PERIOD_SECONDS: float = 1.0
+    SCRAPE_DEDUP_WINDOW_SECONDS: int = 3600
 
     # Validation settings
     VALIDATION_ENABLED: bool = True
     VALIDATION_INTERVAL_HOURS: int = 24
     VALIDATION_TIMEOUT_SECONDS: int = 30
+    VALIDATION_CONNECT_TIMEOUT_SECONDS: float = 3.0
     VALIDATION_MIN_QUALITY_SCORE: int = 70
     VALIDATION_MAX_FAILURES: int = 3
+    VALIDATION_POOL_SIZE: int = 100
+    VALIDATION_CONCURRENCY: int = 50  # URLs in flight per batch
+    VALIDATION_CHUNK_SIZE: int = 1000  # rows per revalidation chunk
+    VALIDATION_LINKS_CHUNK_SIZE: int = 200  # scholarships per commit in link checks
+    VALIDATION_HTTP2: bool = True
+    VALIDATION_MAX_CONTENT_BYTES: int = 65536
+    VALIDATION_MAX_RESPONSE_BYTES: int = 2_000_000
+    VALIDATION_RESULT_CACHE_TTL: int = 300  # seconds, 0 disables
+    VALIDATION_RESULT_CACHE_MAX_ENTRIES: int = 10000
+    VALIDATION_SHARED_CACHE_TTL: int = 21600  # seconds in Redis, 0 disables
+    VALIDATION_SHARED_CACHE_PREFIX: str = "linkval"  # set per environment
 
     # Notification settings
     NOTIFICATION_ENABLED: bool = True
@@ -114,6 +137,8 @@ class Settings(BaseSettings):
     SECURITY_PASSWORD_REQUIRE_SPECIAL: bool = True
     SECURITY_MAX_LOGIN_ATTEMPTS: int = 5
     SECURITY_LOCKOUT_DURATION_MINUTES: int = 30
+    SECURITY_BCRYPT_ROUNDS: int = 12
+    SECURITY_PASSWORD_VERIFY_CACHE_TTL: int = 60  # seconds, 0 disables
 
     # Monitoring settings
     MONITORING_ENABLED: bool = True
@@ -318,6 +343,9 @@ class QueueNames:
     EMAIL: str = "email"
     SMS: str = "sms"
     CLEANUP: str = "cleanup"
+    INGEST: str = "ingest"
+    HOUSEKEEPING: str = "housekeeping"
+    INTERACTIVE: str = "interactive"
 
 # Default values
 
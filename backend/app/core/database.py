@@ -2,14 +2,20 @@
 Database configuration and session management
 """
 
+import csv
+import io
+import json
 import time
+import uuid
 from contextlib import contextmanager
-from sqlalchemy import event
-from sqlalchemy import create_engine
+from sqlalchemy import event, text, update
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
-from typing import Generator
+from typing import Any, Dict, Generator, List
 import logging
 
 from app.core.config import settings
@@ -36,6 +42,7 @@ else:
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
         pool_timeout=settings.DATABASE_POOL_TIMEOUT,
         pool_recycle=3600,
+        pool_pre_ping=True,
         echo=settings.DEBUG,
     )
 
@@ -66,6 +73,124 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+@contextmanager
+def get_db_session() -> Generator[Session, None, None]:
+    """
+    Database session for Celery tasks and service helpers
+
+    Rolled back on error and closed on exit.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    except Exception as e:
+        logger.error(f"Database session error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def init_worker_engine():
+    """
+    Reset the connection pool in a freshly forked worker process
+
+    The engine is created once per process at import. Celery forks its pool
+    workers from the parent after that, so each child drops the inherited
+    pool (without closing the parent's sockets) and builds its own, which
+    every task in that worker then reuses.
+    """
+    engine.dispose(close=False)
+
+
+def bulk_update_by_id(db: Session, model, rows: List[Dict[str, Any]]):
+    """
+    Apply per-row column updates keyed by primary key ``id``
+
+    Small batches (and SQLite) use an executemany UPDATE. On PostgreSQL,
+    batches of at least BULK_UPDATE_COPY_THRESHOLD rows are COPYed into a
+    temp table and applied with a single UPDATE ... FROM, so planning and
+    index maintenance happen once for the whole batch. The temp table is
+    dropped when the transaction commits.
+    """
+    if not rows:
+        return
+    if (settings.DATABASE_URL.startswith("sqlite")
+            or len(rows) < settings.BULK_UPDATE_COPY_THRESHOLD):
+        db.execute(update(model), rows)
+        return
+
+    table = model.__tablename__
+    columns = [column for column in rows[0] if column != "id"]
+    staging = f"tmp_{table}_{uuid.uuid4().hex[:8]}"
+    column_list = ", ".join(["id", *columns])
+
+    db.execute(text(
+        f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {table} WITH NO DATA"
+    ))
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        # JSON columns go through COPY as their JSON text
+        writer.writerow([
+            json.dumps(value) if isinstance(value, (dict, list)) else value
+            for value in (row[column] for column in ["id", *columns])
+        ])
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+    assignments = ", ".join(f"{column} = t.{column}" for column in columns)
+    db.execute(text(
+        f"UPDATE {table} AS s SET {assignments} FROM {staging} AS t WHERE s.id = t.id"
+    ))
+
+
+def set_async_commit(db: Session):
+    """
+    Let the current transaction commit without waiting for the WAL flush
+
+    Only for work that is safe to lose on a crash and redo, such as periodic
+    cleanup. Applies until the transaction ends; no-op on SQLite.
+    """
+    if not settings.DATABASE_URL.startswith("sqlite"):
+        db.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+
+def try_advisory_xact_lock(db: Session, key: int) -> bool:
+    """
+    Try to take a transaction-scoped PostgreSQL advisory lock
+
+    Returns False when another transaction holds the lock. The lock is
+    released when the session's transaction ends. SQLite has no advisory
+    locks and always reports success.
+    """
+    if settings.DATABASE_URL.startswith("sqlite"):
+        return True
+    return bool(db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": key}
+    ).scalar())
+
+
+def dialect_insert(model):
+    """
+    INSERT construct for the configured database that supports ON CONFLICT
+
+    Both the PostgreSQL and SQLite constructs provide on_conflict_do_nothing()
+    and on_conflict_do_update(), so callers can write idempotent inserts
+    without branching on the backend.
+    """
+    if settings.DATABASE_URL.startswith("sqlite"):
+        return sqlite_insert(model)
+    return postgresql_insert(model)
+
+
 def create_tables():
     """Create all database tables"""
     try:
@@ -76,6 +201,55 @@ def create_tables():
         raise
 
 
+def ensure_title_hash_column(batch_size: int = 1000):
+    """
+    Add and backfill scholarships.title_hash on databases created before it
+
+    create_all() does not alter existing tables, so an older scholarships
+    table gets the column and its index here, and rows without a hash are
+    filled in batches. Exact duplicate detection only matches rows that have
+    a hash.
+    """
+    from app.utils.deduplication import DuplicationDetector
+
+    inspector = inspect(engine)
+    if not inspector.has_table("scholarships"):
+        return
+    columns = {column["name"] for column in inspector.get_columns("scholarships")}
+
+    if "title_hash" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE scholarships ADD COLUMN title_hash VARCHAR(40)"))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_scholarships_title_hash "
+                "ON scholarships (title_hash)"))
+        logger.info("Added scholarships.title_hash")
+
+    detector = DuplicationDetector()
+    source_column = "source" if "source" in columns else "NULL"
+    backfilled = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(text(
+                f"SELECT id, title, {source_column} FROM scholarships "
+                f"WHERE title_hash IS NULL LIMIT :limit"
+            ), {"limit": batch_size}).all()
+            if not rows:
+                break
+            conn.execute(
+                text("UPDATE scholarships SET title_hash = :title_hash WHERE id = :id"),
+                [
+                    {"id": row_id, "title_hash": detector.title_hash(title, source)}
+                    for row_id, title, source in rows
+                ]
+            )
+        backfilled += len(rows)
+
+    if backfilled:
+        logger.info(f"Backfilled title_hash for {backfilled} scholarships")
+
+
 def drop_tables():
     """Drop all database tables"""
     try:
@@ -0,0 +1,95 @@
+"""
+Per-process async runtime for Celery workers.
+
+Each worker process keeps one event loop running in a background thread and
+one headless Chromium on that loop, so crawls and scrapes reuse the browser
+(and its connection pool, DNS cache and TLS sessions) across tasks.
+"""
+
+import asyncio
+import threading
+import logging
+from typing import Awaitable, Optional, TypeVar
+
+from playwright.async_api import async_playwright
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# Only touched from the loop thread
+_playwright = None
+_browser = None
+_browser_lock: Optional[asyncio.Lock] = None
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the worker's event loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="worker-event-loop",
+                daemon=True
+            ).start()
+            _loop = loop
+    return _loop
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the worker loop and block until it finishes."""
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    try:
+        return future.result()
+    except BaseException:
+        # Time limits interrupt the waiting thread; stop the coroutine too
+        future.cancel()
+        raise
+
+
+async def get_shared_browser():
+    """Return the worker's Chromium, relaunching it if it has gone away."""
+    global _playwright, _browser, _browser_lock
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(
+                headless=True,
+                args=["--no-sandbox", "--disable-dev-shm-usage"]
+            )
+            logger.info("Launched shared worker browser")
+    return _browser
+
+
+async def _close_browser() -> None:
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+def shutdown() -> None:
+    """Close the shared browser and stop the worker loop."""
+    global _loop
+    with _loop_lock:
+        loop, _loop = _loop, None
+    if loop is None or loop.is_closed():
+        return
+
+    try:
+        asyncio.run_coroutine_threadsafe(_close_browser(), loop).result(timeout=30)
+    except Exception as e:
+        logger.warning(f"Error closing shared browser: {e}")
+    loop.call_soon_threadsafe(loop.stop)
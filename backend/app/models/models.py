@@ -5,7 +5,7 @@ Database models for ShikshaSetu scholarship system
 from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from datetime import datetime
 import uuid
 
@@ -18,6 +18,8 @@ class Scholarship(Base):
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(500), nullable=False, index=True)
+    # sha1(lower(title) + '\x1f' + source), used for exact duplicate lookups
+    title_hash = Column(String(40), nullable=True, index=True)
     description = Column(Text, nullable=False)
     amount = Column(Float, nullable=True, index=True)
     deadline = Column(DateTime, nullable=True, index=True)
@@ -70,6 +72,8 @@ class Scholarship(Base):
         Index('idx_scholarship_deadline', 'deadline', 'is_active'),
         Index('idx_scholarship_quality', 'quality_score', 'is_verified'),
         Index('idx_scholarship_created', 'created_at', 'is_active'),
+        # Revalidation and invalid-link cleanup range over last_validated
+        Index('idx_scholarship_last_validated', 'last_validated'),
     )
 
 
@@ -190,6 +194,7 @@ class Application(Base):
                          name='uq_user_scholarship'),
         Index('idx_application_status', 'status', 'created_at'),
         Index('idx_application_timeline', 'submitted_at', 'status'),
+        Index('idx_application_user_created', 'user_id', 'created_at'),
     )
 
 
@@ -223,7 +228,7 @@ class Notification(Base):
     actions = Column(JSON, nullable=True)  # Available actions
 
     # Timestamps
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=func.now(), index=True)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationships
@@ -234,6 +239,11 @@ class Notification(Base):
         Index('idx_notification_user_status',
               'user_id', 'is_read', 'created_at'),
         Index('idx_notification_type', 'type', 'category', 'created_at'),
+        Index('idx_notification_user_created', 'user_id', 'created_at'),
+        # Partial index for unread counts
+        Index('idx_notification_user_unread', 'user_id',
+              postgresql_where=is_read.is_(False),
+              sqlite_where=is_read.is_(False)),
     )
 
 
@@ -261,6 +271,7 @@ class Bookmark(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint('user_id', 'scholarship_id', name='uq_user_bookmark'),
+        Index('idx_bookmark_user_created', 'user_id', 'created_at'),
     )
 
 
@@ -309,6 +320,7 @@ class Review(Base):
     __table_args__ = (
         UniqueConstraint('user_id', 'scholarship_id', name='uq_user_review'),
         Index('idx_review_scholarship', 'scholarship_id', 'is_published'),
+        Index('idx_review_user_created', 'user_id', 'created_at'),
     )
 
 
@@ -377,6 +389,11 @@ class ScrapingJob(Base):
         Index('idx_scraping_job_status', 'status', 'created_at'),
         Index('idx_scraping_job_source', 'source_name', 'status'),
         Index('idx_scraping_job_schedule', 'next_run_at', 'is_recurring'),
+        Index('idx_scraping_job_completed', 'status', 'completed_at'),
+        # Partial index for the failed-job cleanup
+        Index('idx_scraping_job_failed_created', 'created_at',
+              postgresql_where=text("status = 'failed'"),
+              sqlite_where=text("status = 'failed'")),
     )
 
 
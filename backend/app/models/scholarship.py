@@ -17,6 +17,8 @@ class Scholarship(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(500), nullable=False, index=True)
+    # sha1(lower(title) + '\x1f' + source), used for exact duplicate lookups
+    title_hash = Column(String(40), index=True)
     description = Column(Text)
     url = Column(String(2000), nullable=False)
     amount = Column(Float)
@@ -18,6 +18,15 @@ class BaseSchema(BaseModel):
             Decimal: lambda v: float(v)
         }
 
+
+
+class ListItemSchema(BaseSchema):
+    """Lightweight list entry built from a column-tuple row."""
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(**row._mapping)
+
 # User schemas
 
 
@@ -147,6 +156,16 @@ class ApplicationResponse(ApplicationBase):
     updated_at: datetime
 
 
+class ApplicationListItem(ListItemSchema):
+    id: str
+    scholarship_id: str
+    status: str
+    tracking_id: Optional[str] = None
+    submitted_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
 class ApplicationStatusUpdate(BaseSchema):
     status: str = Field(...,
                         regex=r'^(draft|submitted|under_review|approved|rejected|withdrawn)$')
@@ -174,6 +193,17 @@ class NotificationResponse(NotificationBase):
     read_at: Optional[datetime] = None
     created_at: datetime
 
+
+class NotificationListItem(ListItemSchema):
+    id: str
+    type: str
+    title: str
+    message: str
+    category: str
+    priority: Optional[str] = None
+    is_read: bool
+    created_at: datetime
+
 # Bookmark schemas
 
 
@@ -190,6 +220,13 @@ class BookmarkResponse(BaseSchema):
     created_at: datetime
     updated_at: datetime
 
+class BookmarkListItem(ListItemSchema):
+    id: str
+    scholarship_id: str
+    notes: Optional[str] = None
+    reminder_date: Optional[datetime] = None
+    created_at: datetime
+
 # Review schemas
 
 
@@ -211,6 +248,15 @@ class ReviewResponse(ReviewBase):
     created_at: datetime
     updated_at: datetime
 
+class ReviewListItem(ListItemSchema):
+    id: str
+    scholarship_id: str
+    rating: int
+    comment: Optional[str] = None
+    status: Optional[str] = None
+    is_published: bool
+    created_at: datetime
+
 # Analytics schemas
 
 
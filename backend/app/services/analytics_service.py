@@ -2,11 +2,12 @@
 Analytics service for tracking user behavior, scholarship performance, and system metrics.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Generator
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, func, text
 import logging
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 
@@ -560,8 +561,11 @@ class AnalyticsService:
 # Helper function to get analytics service instance
 
 
-def get_analytics_service(db: Session = None) -> AnalyticsService:
-    """Get analytics service instance."""
-    if db is None:
-        db = next(get_db_session())
-    return AnalyticsService(db)
+@contextmanager
+def get_analytics_service(db: Session = None) -> Generator[AnalyticsService, None, None]:
+    """Get analytics service instance, on a new session unless one is given."""
+    if db is not None:
+        yield AnalyticsService(db)
+        return
+    with get_db_session() as db:
+        yield AnalyticsService(db)
@@ -2,13 +2,14 @@
 Application service for handling scholarship applications and related operations.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Generator
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, func, text
 from fastapi import HTTPException, status
 import uuid
 import logging
+from contextlib import contextmanager
 from enum import Enum
 
 from ..models.models import Application, Scholarship, User, Notification, ActivityLog
@@ -533,8 +534,11 @@ class ApplicationService:
 # Helper function to get application service instance
 
 
-def get_application_service(db: Session = None) -> ApplicationService:
-    """Get application service instance."""
-    if db is None:
-        db = next(get_db_session())
-    return ApplicationService(db)
+@contextmanager
+def get_application_service(db: Session = None) -> Generator[ApplicationService, None, None]:
+    """Get application service instance, on a new session unless one is given."""
+    if db is not None:
+        yield ApplicationService(db)
+        return
+    with get_db_session() as db:
+        yield ApplicationService(db)
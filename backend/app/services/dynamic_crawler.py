@@ -8,6 +8,8 @@ import aiohttp
 from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
 import re
+import time
+from collections import defaultdict
 from urllib.parse import urljoin, urlparse, parse_qs
 from typing import List, Dict, Set, Optional, Tuple
 import logging
@@ -16,8 +18,39 @@ from dataclasses import dataclass
 import json
 from pathlib import Path
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+class _TokenBucket:
+    """
+    Allows `rate` acquisitions per `per` seconds, with bursts up to `rate`
+    """
+
+    __slots__ = ('rate', 'per', 'tokens', 'updated', 'lock')
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) * self.per / self.rate)
+
 
 @dataclass
 class DiscoveredPage:
@@ -38,7 +71,10 @@ class DynamicScholarshipCrawler:
     Advanced crawler that dynamically discovers scholarship pages
     """
 
-    def __init__(self):
+    def __init__(self, browser=None):
+        # Optional long-lived Playwright browser owned by the caller
+        self.browser = browser
+
         self.visited_urls: Set[str] = set()
         self.discovered_pages: List[DiscoveredPage] = []
 
@@ -89,24 +125,47 @@ class DynamicScholarshipCrawler:
     async def discover_scholarship_sources(self,
                                            seed_urls: List[str],
                                            max_depth: int = 3,
-                                           max_pages_per_source: int = 50) -> List[DiscoveredPage]:
+                                           max_pages_per_source: int = 50,
+                                           max_concurrent: Optional[int] = None,
+                                           requests_per_period: Optional[int] = None,
+                                           period: Optional[float] = None) -> List[DiscoveredPage]:
         """
         Dynamically discover scholarship pages starting from seed URLs
+
+        Seeds are crawled concurrently with at most `max_concurrent` pages
+        open, and each domain is limited to `requests_per_period` page loads
+        per `period` seconds.
         """
         logger.info(
             f"Starting dynamic discovery from {len(seed_urls)} seed URLs")
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-
-            # Process seed URLs
-            for seed_url in seed_urls:
-                await self._crawl_source(context, seed_url, max_depth, max_pages_per_source)
-
-            await browser.close()
+        self._semaphore = asyncio.Semaphore(
+            max_concurrent or settings.CRAWLER_MAX_CONCURRENT_PAGES)
+        rate = requests_per_period or settings.CRAWLER_REQUESTS_PER_PERIOD
+        per = period or settings.CRAWLER_RATE_PERIOD_SECONDS
+        self._domain_buckets = defaultdict(lambda: _TokenBucket(rate, per))
+
+        async def crawl_seeds(context):
+            await asyncio.gather(*(
+                self._crawl_source(context, seed_url, max_depth, max_pages_per_source)
+                for seed_url in seed_urls
+            ))
+
+        if self.browser is not None:
+            context = await self.browser.new_context(user_agent=_USER_AGENT)
+            try:
+                await crawl_seeds(context)
+            finally:
+                await context.close()
+        else:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=True)
+                context = await browser.new_context(user_agent=_USER_AGENT)
+
+                # Process seed URLs
+                await crawl_seeds(context)
+
+                await browser.close()
 
         # Sort by relevance score
         self.discovered_pages.sort(
@@ -127,34 +186,39 @@ class DynamicScholarshipCrawler:
         if len(self.visited_urls) >= max_pages:
             return
 
-        page = await context.new_page()
+        links = []
 
-        try:
-            await page.goto(base_url, timeout=30000)
-            await page.wait_for_load_state('networkidle', timeout=10000)
+        # Hold a concurrency slot only while the page is open, so deep
+        # recursion cannot starve the other seeds
+        async with self._semaphore:
+            await self._domain_buckets[urlparse(base_url).netloc].acquire()
+            page = await context.new_page()
 
-            # Extract page content and analyze
-            content = await page.content()
-            page_info = await self._analyze_page(page, base_url, content)
+            try:
+                await page.goto(base_url, timeout=30000)
+                await page.wait_for_load_state('networkidle', timeout=10000)
 
-            if page_info and page_info.relevance_score > 0.3:
-                self.discovered_pages.append(page_info)
+                # Extract page content and analyze
+                content = await page.content()
+                page_info = await self._analyze_page(page, base_url, content)
 
-            self.visited_urls.add(base_url)
+                if page_info and page_info.relevance_score > 0.3:
+                    self.discovered_pages.append(page_info)
 
-            # Find links to explore further
-            if max_depth > 0:
-                links = await self._extract_relevant_links(page, base_url)
+                self.visited_urls.add(base_url)
 
-                for link in links[:10]:  # Limit concurrent processing
-                    if link not in self.visited_urls and len(self.visited_urls) < max_pages:
-                        await asyncio.sleep(1)  # Rate limiting
-                        await self._crawl_source(context, link, max_depth - 1, max_pages)
+                # Find links to explore further
+                if max_depth > 0:
+                    links = await self._extract_relevant_links(page, base_url)
 
-        except Exception as e:
-            logger.warning(f"Error crawling {base_url}: {str(e)}")
-        finally:
-            await page.close()
+            except Exception as e:
+                logger.warning(f"Error crawling {base_url}: {str(e)}")
+            finally:
+                await page.close()
+
+        for link in links[:10]:  # Limit concurrent processing
+            if link not in self.visited_urls and len(self.visited_urls) < max_pages:
+                await self._crawl_source(context, link, max_depth - 1, max_pages)
 
     async def _analyze_page(self, page, url: str, content: str) -> Optional[DiscoveredPage]:
         """
@@ -2,20 +2,45 @@
 Notification service for handling user notifications and communication.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Generator
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, func
 from fastapi import HTTPException, status
 import uuid
 import logging
+import smtplib
+from contextlib import contextmanager
+from email.message import EmailMessage
+from email.utils import formataddr
 from enum import Enum
 
 from ..models.models import Notification, User
+from ..core.config import settings
 from ..core.database import get_db_session
 
 logger = logging.getLogger(__name__)
 
+# (subject, body) format strings per email notification type, filled from
+# the per-recipient data
+_EMAIL_TEMPLATES = {
+    'deadline_reminder': (
+        "Scholarship Deadline Reminder: {scholarship[title]}",
+        "The deadline for '{scholarship[title]}' is in {days_remaining} days. Don't miss out!"
+    ),
+}
+
+
+def _build_email(sender: str, to_address: str, subject_template: str, body_template: str,
+                 data: Dict[str, Any]) -> EmailMessage:
+    """Fill a subject/body template pair into an email message."""
+    message = EmailMessage()
+    message['From'] = sender
+    message['To'] = to_address
+    message['Subject'] = subject_template.format(**data)
+    message.set_content(body_template.format(**data))
+    return message
+
 
 class NotificationType(str, Enum):
     APPLICATION_SUBMITTED = "APPLICATION_SUBMITTED"
@@ -227,6 +252,66 @@ class NotificationService:
             logger.error(f"Error creating bulk notifications: {str(e)}")
             return []
 
+    def send_bulk_email_notifications(self, notification_type: str,
+                                      recipients: List[Tuple[User, Dict[str, Any]]]) -> int:
+        """
+        Send one templated email per (user, data) pair over a single SMTP
+        connection. Returns the number of messages accepted.
+        """
+        subject_template, body_template = _EMAIL_TEMPLATES[notification_type]
+        sender = formataddr((settings.EMAIL_FROM_NAME, settings.EMAIL_FROM))
+        sent = 0
+
+        try:
+            with smtplib.SMTP(settings.EMAIL_HOST, settings.EMAIL_PORT) as smtp:
+                if settings.EMAIL_USE_TLS:
+                    smtp.starttls()
+                if settings.EMAIL_USERNAME:
+                    smtp.login(settings.EMAIL_USERNAME,
+                               settings.EMAIL_PASSWORD)
+
+                for user, data in recipients:
+                    message = _build_email(sender, user.email, subject_template, body_template, data)
+                    try:
+                        smtp.send_message(message)
+                        sent += 1
+                    except smtplib.SMTPRecipientsRefused:
+                        logger.warning(f"Email to user {user.id} refused")
+
+        except Exception as e:
+            logger.error(f"Error sending bulk email notifications: {str(e)}")
+
+        logger.info(f"Sent {sent}/{len(recipients)} {notification_type} emails")
+        return sent
+
+    @staticmethod
+    def send_email(to_address: str, notification_type: str, data: Dict[str, Any]) -> bool:
+        """
+        Send one templated email over its own SMTP connection.
+
+        Takes plain values and never touches the database session, so it is
+        safe to call from worker threads.
+        """
+        template = _EMAIL_TEMPLATES.get(notification_type)
+        if template is None:
+            logger.warning(f"No email template for notification type {notification_type}")
+            return False
+
+        sender = formataddr((settings.EMAIL_FROM_NAME, settings.EMAIL_FROM))
+        try:
+            message = _build_email(sender, to_address, template[0], template[1], data)
+            with smtplib.SMTP(settings.EMAIL_HOST, settings.EMAIL_PORT) as smtp:
+                if settings.EMAIL_USE_TLS:
+                    smtp.starttls()
+                if settings.EMAIL_USERNAME:
+                    smtp.login(settings.EMAIL_USERNAME,
+                               settings.EMAIL_PASSWORD)
+                smtp.send_message(message)
+            return True
+        except Exception as e:
+            logger.error(f"Error sending {notification_type} email: {str(e)}")
+            return False
+
     def send_deadline_reminders(self, days_before: int = 7) -> int:
         """Send deadline reminders for scholarships."""
         try:
@@ -295,6 +380,33 @@ class NotificationService:
             logger.error(f"Error cleaning up old notifications: {str(e)}")
             return 0
 
+    @staticmethod
+    def should_notify_user(user: Any, scholarship: Any) -> bool:
+        """
+        Check a user's JSON settings before emailing them about a scholarship.
+
+        Users who turned off email or scholarship reminders in
+        ``notification_settings`` are skipped. When ``preferences`` lists
+        categories, states or levels, the scholarship must match each list
+        that is present. ``user`` may be a User or a row with the same
+        columns.
+        """
+        notification_settings = user.notification_settings or {}
+        if not notification_settings.get("email_enabled", True):
+            return False
+        if not notification_settings.get("scholarship_reminders", True):
+            return False
+
+        preferences = user.preferences or {}
+        for key, value in (("categories", scholarship.category),
+                           ("states", scholarship.state),
+                           ("levels", scholarship.level)):
+            wanted = preferences.get(key)
+            if wanted and (value or "").lower() not in {w.lower() for w in wanted}:
+                return False
+
+        return True
+
     def get_notification_preferences(self, user_id: str) -> Dict[str, Any]:
         """Get user's notification preferences."""
         try:
@@ -362,8 +474,11 @@ class NotificationService:
 # Helper function to get notification service instance
 
 
-def get_notification_service(db: Session = None) -> NotificationService:
-    """Get notification service instance."""
-    if db is None:
-        db = next(get_db_session())
-    return NotificationService(db)
+@contextmanager
+def get_notification_service(db: Session = None) -> Generator[NotificationService, None, None]:
+    """Get notification service instance, on a new session unless one is given."""
+    if db is not None:
+        yield NotificationService(db)
+        return
+    with get_db_session() as db:
+        yield NotificationService(db)
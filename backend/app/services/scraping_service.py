@@ -6,15 +6,17 @@ import asyncio
 import aiohttp
 import json
 import re
+import sys
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from contextlib import asynccontextmanager
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright
 from dataclasses import dataclass, asdict
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func
 
 from app.core.config import settings
 from app.core.database import db_transaction
@@ -31,6 +33,59 @@ from app.utils.deduplication import DuplicationDetector
 
 logger = logging.getLogger(__name__)
 
+# Class names that mark scholarship containers in fallback extraction
+_FALLBACK_CLASS_RE = re.compile(
+    r'scholarship|scheme|grant|award|fellowship', re.I)
+
+# Common state abbreviations
+_STATE_ABBREVIATIONS = {
+    'up': 'Uttar Pradesh',
+    'mp': 'Madhya Pradesh',
+    'hp': 'Himachal Pradesh',
+    'ap': 'Andhra Pradesh',
+    'tn': 'Tamil Nadu',
+    'wb': 'West Bengal',
+    'rj': 'Rajasthan',
+    'gj': 'Gujarat',
+    'mh': 'Maharashtra',
+    'ka': 'Karnataka',
+    'kl': 'Kerala',
+    'od': 'Odisha',
+    'as': 'Assam',
+    'jh': 'Jharkhand',
+    'ch': 'Chhattisgarh',
+    'hr': 'Haryana',
+    'pb': 'Punjab',
+    'br': 'Bihar',
+    'uk': 'Uttarakhand',
+    'ga': 'Goa',
+    'sk': 'Sikkim',
+    'mn': 'Manipur',
+    'mg': 'Meghalaya',
+    'mz': 'Mizoram',
+    'nl': 'Nagaland',
+    'tr': 'Tripura',
+    'ar': 'Arunachal Pradesh'
+}
+
+# Word boundaries keep abbreviations like 'as' from matching inside 'class'
+_STATE_ABBR_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, _STATE_ABBREVIATIONS)) + r')\b')
+
+# Keywords and institution types recognised as scholarship tags
+_TAG_KEYWORDS = (
+    'scholarship', 'fellowship', 'grant', 'award', 'stipend',
+    'merit', 'need', 'minority', 'women', 'disabled', 'sports',
+    'arts', 'science', 'technology', 'medical', 'engineering',
+    'government', 'private', 'international', 'research',
+    'university', 'college', 'school', 'institute', 'iit', 'nit', 'iiit', 'aiims'
+)
+
+# Zero-width lookahead so overlapping keywords (e.g. "iiit" / "iit") all match
+# in a single pass over the text
+_TAG_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(_TAG_KEYWORDS, key=len, reverse=True))) + '))')
+
 
 @dataclass
 class ScrapedScholarship:
@@ -61,7 +116,12 @@ class ScrapedScholarship:
 class ScrapingService:
     """Advanced scholarship scraping service with AI-powered extraction"""
 
-    def __init__(self):
+    def __init__(self, browser=None):
+        # Optional long-lived Playwright browser owned by the caller; when
+        # set, each scrape opens a fresh context on it instead of launching
+        # its own Chromium
+        self.browser = browser
+
         self.validation_service = ValidationService()
         self.ai_service = AIService()
         self.text_processor = TextProcessor()
@@ -70,6 +130,9 @@ class ScrapingService:
         self.link_validator = LinkValidator()
         self.duplication_detector = DuplicationDetector()
 
+        # Interned values for low-cardinality fields shared across scholarships
+        self._intern: Dict[str, str] = {}
+
         # Scraping configuration
         self.config = {
             'timeout': settings.SCRAPING_TIMEOUT_SECONDS,
@@ -147,25 +210,97 @@ class ScrapingService:
             }
         }
 
+        # Source listing is static per configuration, so build it once
+        self._static_sources = [
+            {
+                'name': source_name,
+                'url': f"https://{source_name}",
+                'description': f"Scholarships from {source_name}",
+                'supported_features': {
+                    'pagination': config.get('pagination', {}).get('enabled', False),
+                    'ai_extraction': True,
+                    'link_validation': True
+                },
+                'last_scraped': None,
+                'status': 'active'
+            }
+            for source_name, config in self.source_configs.items()
+        ]
+
     async def scrape_scholarships(self, source_url: str, source_name: str,
                                   max_pages: int = 10) -> List[ScrapedScholarship]:
         """
         Scrape scholarships from a source with AI-powered extraction
         """
-        scholarships = []
+        return [
+            scholarship
+            async for scholarship in self.iter_scholarships(
+                source_url, source_name, max_pages)
+        ]
 
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=self.config['headless'],
-                    args=['--no-sandbox', '--disable-dev-shm-usage']
-                )
+    async def scrape_multiple_sources(self, sources: List[Tuple[str, str]],
+                                      max_pages: int = 10) -> Dict[str, List[ScrapedScholarship]]:
+        """
+        Scrape several sources concurrently, bounded by max_concurrent
+        """
+        semaphore = asyncio.Semaphore(self.config['max_concurrent'])
+
+        async def scrape_one(source_url: str, source_name: str) -> List[ScrapedScholarship]:
+            async with semaphore:
+                return await self.scrape_scholarships(source_url, source_name, max_pages)
+
+        results = await asyncio.gather(
+            *(scrape_one(url, name) for url, name in sources),
+            return_exceptions=True
+        )
+
+        scraped = {}
+        for (source_url, source_name), result in zip(sources, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping {source_name}: {result}")
+                continue
+            scraped[source_name] = result
 
-                context = await browser.new_context(
+        return scraped
+
+    @asynccontextmanager
+    async def _browser_context(self):
+        """
+        Open a browser context on the shared browser, or on a private one
+        """
+        if self.browser is not None:
+            context = await self.browser.new_context(
+                user_agent=self.config['user_agent'],
+                viewport=self.config['viewport']
+            )
+            try:
+                yield context
+            finally:
+                await context.close()
+            return
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(
+                headless=self.config['headless'],
+                args=['--no-sandbox', '--disable-dev-shm-usage']
+            )
+            try:
+                yield await browser.new_context(
                     user_agent=self.config['user_agent'],
                     viewport=self.config['viewport']
                 )
+            finally:
+                await browser.close()
 
+    async def iter_scholarships(self, source_url: str, source_name: str,
+                                max_pages: int = 10) -> AsyncIterator[ScrapedScholarship]:
+        """
+        Scrape scholarships from a source, yielding them page by page
+        """
+        scraped_count = 0
+
+        try:
+            async with self._browser_context() as context:
                 page = await context.new_page()
 
                 # Get source-specific configuration
@@ -189,7 +324,9 @@ class ScrapingService:
                 page_scholarships = await self._extract_scholarships_from_page(
                     page, source_name, source_config
                 )
-                scholarships.extend(page_scholarships)
+                scraped_count += len(page_scholarships)
+                for scholarship in page_scholarships:
+                    yield scholarship
 
                 # Handle pagination if enabled
                 if source_config.get('pagination', {}).get('enabled', False):
@@ -218,26 +355,26 @@ class ScrapingService:
                             page_scholarships = await self._extract_scholarships_from_page(
                                 page, source_name, source_config
                             )
-                            scholarships.extend(page_scholarships)
 
                             current_page += 1
 
-                            # Delay between pages
-                            await asyncio.sleep(self.config['delay'])
-
                         except Exception as e:
                             logger.error(f"Error navigating to next page: {e}")
                             break
 
-                await browser.close()
+                        scraped_count += len(page_scholarships)
+                        for scholarship in page_scholarships:
+                            yield scholarship
+
+                        # Delay between pages
+                        await asyncio.sleep(self.config['delay'])
 
         except Exception as e:
             logger.error(f"Error scraping {source_name}: {e}")
             raise
 
         logger.info(
-            f"Scraped {len(scholarships)} scholarships from {source_name}")
-        return scholarships
+            f"Scraped {scraped_count} scholarships from {source_name}")
 
     async def _extract_scholarships_from_page(self, page, source_name: str,
                                               source_config: Dict) -> List[ScrapedScholarship]:
@@ -251,23 +388,38 @@ class ScrapingService:
             content = await page.content()
             soup = BeautifulSoup(content, 'html.parser')
 
+            # Rendered text (visible content only) for AI analysis
+            try:
+                body_text = await page.evaluate("document.body.innerText")
+            except Exception:
+                body_text = None
+
             # Use AI to identify scholarship entries
-            scholarship_elements = await self._identify_scholarship_elements(soup, source_config)
+            scholarship_elements = await self._identify_scholarship_elements(
+                soup, source_config, body_text)
 
+            raw_items = []
             for element in scholarship_elements:
                 try:
                     # Extract scholarship data using AI
-                    scholarship_data = await self._extract_scholarship_data(
+                    raw_items.append(await self._extract_raw_data(
                         element, source_name, source_config
-                    )
-
-                    if scholarship_data:
-                        scholarships.append(scholarship_data)
+                    ))
 
                 except Exception as e:
                     logger.error(f"Error extracting scholarship data: {e}")
                     continue
 
+            # Clean the whole page in one batch
+            for cleaned_data in await self._clean_batch(raw_items, source_name):
+                if not cleaned_data:
+                    continue
+                try:
+                    scholarships.append(
+                        self._build_scholarship(cleaned_data, source_name))
+                except Exception as e:
+                    logger.error(f"Error extracting scholarship data: {e}")
+
             # If no scholarships found with AI, try fallback extraction
             if not scholarships:
                 scholarships = await self._fallback_extraction(soup, source_name, source_config)
@@ -279,7 +431,8 @@ class ScrapingService:
         return scholarships
 
     async def _identify_scholarship_elements(self, soup: BeautifulSoup,
-                                             source_config: Dict) -> List:
+                                             source_config: Dict,
+                                             body_text: Optional[str] = None) -> List:
         """
         Use AI to identify scholarship elements on the page
         """
@@ -302,7 +455,7 @@ class ScrapingService:
 
         # If no elements found, use AI to analyze the entire page
         if not elements:
-            elements = await self._ai_identify_scholarships(soup)
+            elements = await self._ai_identify_scholarships(soup, body_text)
 
         return elements
 
@@ -327,13 +480,14 @@ class ScrapingService:
 
         return validated[:50]  # Limit to prevent overload
 
-    async def _ai_identify_scholarships(self, soup: BeautifulSoup) -> List:
+    async def _ai_identify_scholarships(self, soup: BeautifulSoup,
+                                        body_text: Optional[str] = None) -> List:
         """
         Use AI to identify scholarship content when standard selectors fail
         """
         try:
-            # Extract text content for AI analysis
-            text_content = soup.get_text(strip=True)
+            # Prefer the browser-rendered text; only walk the tree without it
+            text_content = body_text or soup.get_text(strip=True)
 
             # Use AI service to identify scholarship sections
             scholarship_sections = await self.ai_service.identify_scholarship_sections(text_content)
@@ -359,21 +513,8 @@ class ScrapingService:
         Extract scholarship data from an element using AI-powered extraction
         """
         try:
-            # Get element text content
-            text_content = element.get_text(strip=True)
-            html_content = str(element)
-
-            # Use AI to extract structured data
-            ai_extracted = await self.ai_service.extract_scholarship_data(
-                text_content, html_content, source_name
-            )
-
-            # Use traditional extraction as fallback
-            traditional_extracted = await self._traditional_extraction(element, source_config)
-
-            # Merge AI and traditional extraction results
-            merged_data = self._merge_extraction_results(
-                ai_extracted, traditional_extracted)
+            merged_data = await self._extract_raw_data(
+                element, source_name, source_config)
 
             # Validate and clean extracted data
             cleaned_data = await self._clean_and_validate_data(merged_data, source_name)
@@ -381,41 +522,76 @@ class ScrapingService:
             if not cleaned_data:
                 return None
 
-            # Create ScrapedScholarship object
-            scholarship = ScrapedScholarship(
-                title=cleaned_data.get('title', ''),
-                description=cleaned_data.get('description', ''),
-                amount=cleaned_data.get('amount'),
-                deadline=cleaned_data.get('deadline'),
-                eligibility=cleaned_data.get('eligibility', []),
-                application_url=cleaned_data.get('application_url', ''),
-                source=source_name,
-                category=cleaned_data.get('category', 'general'),
-                level=cleaned_data.get('level', 'all-levels'),
-                state=cleaned_data.get('state', 'All India'),
-                provider=cleaned_data.get('provider', ''),
-                contact_email=cleaned_data.get('contact_email'),
-                contact_phone=cleaned_data.get('contact_phone'),
-                application_process=cleaned_data.get(
-                    'application_process', ''),
-                benefits=cleaned_data.get('benefits', []),
-                selection_criteria=cleaned_data.get('selection_criteria', []),
-                required_documents=cleaned_data.get('required_documents', []),
-                tags=cleaned_data.get('tags', []),
-                raw_data=cleaned_data,
-                scraped_at=datetime.utcnow()
-            )
-
-            # Calculate quality score
-            scholarship.quality_score = self._calculate_quality_score(
-                scholarship)
-
-            return scholarship
+            return self._build_scholarship(cleaned_data, source_name)
 
         except Exception as e:
             logger.error(f"Error extracting scholarship data: {e}")
             return None
 
+    async def _extract_raw_data(self, element, source_name: str,
+                                source_config: Dict) -> Dict[str, Any]:
+        """
+        Run AI and traditional extraction on an element and merge the results
+        """
+        # Get element text content
+        text_content = element.get_text(strip=True)
+        html_content = str(element)
+
+        # Use AI to extract structured data
+        ai_extracted = await self.ai_service.extract_scholarship_data(
+            text_content, html_content, source_name
+        )
+
+        # Use traditional extraction as fallback
+        traditional_extracted = await self._traditional_extraction(element, source_config)
+
+        # Merge AI and traditional extraction results
+        return self._merge_extraction_results(
+            ai_extracted, traditional_extracted)
+
+    def _build_scholarship(self, cleaned_data: Dict[str, Any], source_name: str) -> ScrapedScholarship:
+        """
+        Create a scored ScrapedScholarship from cleaned data
+        """
+        scholarship = ScrapedScholarship(
+            title=cleaned_data.get('title', ''),
+            description=cleaned_data.get('description', ''),
+            amount=cleaned_data.get('amount'),
+            deadline=cleaned_data.get('deadline'),
+            eligibility=cleaned_data.get('eligibility', []),
+            application_url=cleaned_data.get('application_url', ''),
+            source=self._intern_str(source_name),
+            category=self._intern_str(
+                cleaned_data.get('category', 'general')),
+            level=self._intern_str(cleaned_data.get('level', 'all-levels')),
+            state=self._intern_str(cleaned_data.get('state', 'All India')),
+            provider=self._intern_str(cleaned_data.get('provider', '')),
+            contact_email=cleaned_data.get('contact_email'),
+            contact_phone=cleaned_data.get('contact_phone'),
+            application_process=cleaned_data.get(
+                'application_process', ''),
+            benefits=cleaned_data.get('benefits', []),
+            selection_criteria=cleaned_data.get('selection_criteria', []),
+            required_documents=cleaned_data.get('required_documents', []),
+            tags=cleaned_data.get('tags', []),
+            raw_data=cleaned_data,
+            scraped_at=datetime.utcnow()
+        )
+
+        # Calculate quality score
+        scholarship.quality_score = self._calculate_quality_score(
+            scholarship)
+
+        return scholarship
+
+    def _intern_str(self, value: str) -> str:
+        """
+        Return a shared instance of a repeated string value
+        """
+        if not isinstance(value, str):
+            return value
+        return self._intern.setdefault(value, sys.intern(value))
+
     async def _traditional_extraction(self, element, source_config: Dict) -> Dict[str, Any]:
         """
         Traditional extraction using CSS selectors
@@ -510,6 +686,22 @@ class ScrapingService:
         """
         Clean and validate extracted scholarship data
         """
+        return self._clean_data(data, source_name)
+
+    async def _clean_batch(self, items: List[Dict[str, Any]],
+                           source_name: str) -> List[Optional[Dict[str, Any]]]:
+        """
+        Clean a batch of extracted data
+
+        Runs inline: a page yields at most a few dozen items, too few to pay
+        for shipping them to worker processes.
+        """
+        return [self._clean_data(item, source_name) for item in items]
+
+    def _clean_data(self, data: Dict[str, Any], source_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Synchronous cleanup used by _clean_batch and _clean_and_validate_data
+        """
         try:
             # Clean title
             title = data.get('title', '').strip()
@@ -567,18 +759,21 @@ class ScrapingService:
             title = self.text_processor.clean_text(title)
             description = self.text_processor.clean_text(description)
 
+            # Lowercase the searchable text once for all detectors
+            title_description_lower = f"{title} {description}".lower()
+            full_text_lower = f"{title_description_lower} {' '.join(eligibility).lower()}"
+
             # Extract category from title/description
-            category = self._extract_category(title, description)
+            category = self._extract_category(title_description_lower)
 
             # Extract education level
-            level = self._extract_education_level(
-                title, description, eligibility)
+            level = self._extract_education_level(full_text_lower)
 
             # Extract state
-            state = self._extract_state(title, description, eligibility)
+            state = self._extract_state(full_text_lower)
 
             # Generate tags
-            tags = self._generate_tags(title, description, eligibility)
+            tags = self._generate_tags(full_text_lower)
 
             cleaned_data = {
                 'title': title,
@@ -664,12 +859,10 @@ class ScrapingService:
 
         return min(score, 100)
 
-    def _extract_category(self, title: str, description: str) -> str:
+    def _extract_category(self, text: str) -> str:
         """
-        Extract scholarship category from title and description
+        Extract scholarship category from lowercased title and description
         """
-        text = f"{title} {description}".lower()
-
         category_keywords = {
             'merit': ['merit', 'toppers', 'academic excellence', 'outstanding'],
             'need-based': ['need based', 'financial aid', 'economically weaker', 'poor'],
@@ -697,12 +890,10 @@ class ScrapingService:
 
         return 'general'
 
-    def _extract_education_level(self, title: str, description: str, eligibility: List[str]) -> str:
+    def _extract_education_level(self, text: str) -> str:
         """
-        Extract education level from scholarship information
+        Extract education level from lowercased scholarship text
         """
-        text = f"{title} {description} {' '.join(eligibility)}".lower()
-
         level_keywords = {
             'pre-matric': ['pre matric', 'class 9', 'class 10', '9th', '10th'],
             'post-matric': ['post matric', 'class 11', 'class 12', '11th', '12th'],
@@ -721,81 +912,26 @@ class ScrapingService:
 
         return 'all-levels'
 
-    def _extract_state(self, title: str, description: str, eligibility: List[str]) -> str:
+    def _extract_state(self, text: str) -> str:
         """
-        Extract state from scholarship information
+        Extract state from lowercased scholarship text
         """
-        text = f"{title} {description} {' '.join(eligibility)}".lower()
-
         for state in settings.INDIAN_STATES:
             if state.lower() in text:
                 return state
 
-        # Check for common state abbreviations
-        state_abbr = {
-            'up': 'Uttar Pradesh',
-            'mp': 'Madhya Pradesh',
-            'hp': 'Himachal Pradesh',
-            'ap': 'Andhra Pradesh',
-            'tn': 'Tamil Nadu',
-            'wb': 'West Bengal',
-            'rj': 'Rajasthan',
-            'gj': 'Gujarat',
-            'mh': 'Maharashtra',
-            'ka': 'Karnataka',
-            'kl': 'Kerala',
-            'od': 'Odisha',
-            'as': 'Assam',
-            'jh': 'Jharkhand',
-            'ch': 'Chhattisgarh',
-            'hr': 'Haryana',
-            'pb': 'Punjab',
-            'br': 'Bihar',
-            'uk': 'Uttarakhand',
-            'ga': 'Goa',
-            'sk': 'Sikkim',
-            'mn': 'Manipur',
-            'mg': 'Meghalaya',
-            'mz': 'Mizoram',
-            'nl': 'Nagaland',
-            'tr': 'Tripura',
-            'ar': 'Arunachal Pradesh'
-        }
-
-        for abbr, full_name in state_abbr.items():
-            if abbr in text:
-                return full_name
+        # Check for common state abbreviations as whole words only
+        match = _STATE_ABBR_RE.search(text)
+        if match:
+            return _STATE_ABBREVIATIONS[match.group(1)]
 
         return 'All India'
 
-    def _generate_tags(self, title: str, description: str, eligibility: List[str]) -> List[str]:
+    def _generate_tags(self, text: str) -> List[str]:
         """
-        Generate tags for scholarship
+        Generate tags from lowercased scholarship text
         """
-        text = f"{title} {description} {' '.join(eligibility)}".lower()
-
-        tags = []
-
-        # Extract keywords
-        keywords = [
-            'scholarship', 'fellowship', 'grant', 'award', 'stipend',
-            'merit', 'need', 'minority', 'women', 'disabled', 'sports',
-            'arts', 'science', 'technology', 'medical', 'engineering',
-            'government', 'private', 'international', 'research'
-        ]
-
-        for keyword in keywords:
-            if keyword in text:
-                tags.append(keyword)
-
-        # Extract institution types
-        institution_types = ['university', 'college',
-                             'school', 'institute', 'iit', 'nit', 'iiit', 'aiims']
-        for inst_type in institution_types:
-            if inst_type in text:
-                tags.append(inst_type)
-
-        return list(set(tags))  # Remove duplicates
+        return list(set(_TAG_RE.findall(text)))
 
     async def _fallback_extraction(self, soup: BeautifulSoup, source_name: str,
                                    source_config: Dict) -> List[ScrapedScholarship]:
@@ -807,28 +943,39 @@ class ScrapingService:
         try:
             # Look for any links or sections that might contain scholarships
             potential_elements = soup.find_all(['div', 'section', 'article', 'li'],
-                                               class_=re.compile(r'scholarship|scheme|grant|award|fellowship', re.I))
+                                               class_=_FALLBACK_CLASS_RE)
 
+            basic_items = []
             for element in potential_elements:
                 try:
                     text_content = element.get_text(strip=True)
                     if len(text_content) > 100:  # Minimum content length
                         # Try to extract basic information
-                        basic_data = {
+                        basic_items.append({
                             'title': self._extract_title_from_text(text_content),
                             # First 500 chars
                             'description': text_content[:500],
                             'source': source_name
-                        }
+                        })
 
-                        cleaned_data = await self._clean_and_validate_data(basic_data, source_name)
-                        if cleaned_data:
-                            scholarship = ScrapedScholarship(**cleaned_data,
-                                                             raw_data=basic_data,
-                                                             scraped_at=datetime.utcnow())
-                            scholarship.quality_score = self._calculate_quality_score(
-                                scholarship)
-                            scholarships.append(scholarship)
+                except Exception as e:
+                    logger.debug(f"Error in fallback extraction: {e}")
+                    continue
+
+            cleaned_items = await self._clean_batch(basic_items, source_name)
+            for basic_data, cleaned_data in zip(basic_items, cleaned_items):
+                if not cleaned_data:
+                    continue
+                try:
+                    for field in ('category', 'level', 'state', 'provider'):
+                        cleaned_data[field] = self._intern_str(
+                            cleaned_data.get(field) or '')
+                    scholarship = ScrapedScholarship(**cleaned_data,
+                                                     raw_data=basic_data,
+                                                     scraped_at=datetime.utcnow())
+                    scholarship.quality_score = self._calculate_quality_score(
+                        scholarship)
+                    scholarships.append(scholarship)
 
                 except Exception as e:
                     logger.debug(f"Error in fallback extraction: {e}")
@@ -843,12 +990,18 @@ class ScrapingService:
         """
         Extract title from text content
         """
-        # Split by common separators and take the first meaningful line
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if len(line) > 10 and len(line) < 200:
+        # Walk lines with str.find and take the first meaningful one, without
+        # materializing every line of long descriptions
+        start = 0
+        length = len(text)
+        while start <= length:
+            end = text.find('\n', start)
+            if end == -1:
+                end = length
+            line = text[start:end].strip()
+            if 10 < len(line) < 200:
                 return line
+            start = end + 1
 
         # If no good line found, take first 100 characters
         return text[:100].strip()
@@ -858,20 +1011,46 @@ class ScrapingService:
         Save scraped scholarships to database with deduplication
         """
         saved_count = 0
+        batch_size = settings.SCRAPING_SAVE_BATCH_SIZE
 
         try:
-            for scholarship in scholarships:
-                try:
-                    # Check for duplicates
-                    is_duplicate = await self.duplication_detector.is_duplicate(
-                        db, scholarship.title, scholarship.description, scholarship.source
+            # Look up exact duplicates for the whole batch in one query
+            hashes = [
+                self.duplication_detector.title_hash(s.title, s.source)
+                for s in scholarships
+            ]
+            unique_hashes = list(set(hashes))
+            existing_hashes = set()
+            for i in range(0, len(unique_hashes), batch_size):
+                existing_hashes.update(
+                    title_hash for (title_hash,) in db.query(Scholarship.title_hash).filter(
+                        Scholarship.title_hash.in_(
+                            unique_hashes[i:i + batch_size])
                     )
+                )
 
-                    if is_duplicate:
+            # Fuzzy matching is one query per item, so only run it for small batches
+            use_fuzzy = len(scholarships) < settings.SCRAPING_FUZZY_DEDUP_MAX_BATCH
+
+            rows = []
+            for scholarship, title_hash in zip(scholarships, hashes):
+                try:
+                    # Check for duplicates
+                    if title_hash in existing_hashes:
                         logger.debug(
                             f"Duplicate scholarship found: {scholarship.title}")
                         continue
 
+                    if use_fuzzy:
+                        is_duplicate = await self.duplication_detector.is_duplicate(
+                            db, scholarship.title, scholarship.description, scholarship.source
+                        )
+
+                        if is_duplicate:
+                            logger.debug(
+                                f"Duplicate scholarship found: {scholarship.title}")
+                            continue
+
                     # Validate scholarship data
                     if not await self.validation_service.validate_scholarship_data(scholarship):
                         logger.warning(
@@ -905,20 +1084,24 @@ class ScrapingService:
                         scraped_at=scholarship.scraped_at
                     )
 
-                    # Save to database
-                    db_scholarship = Scholarship(**scholarship_data.dict())
-                    db.add(db_scholarship)
-                    db.commit()
-
-                    saved_count += 1
-                    logger.info(f"Saved scholarship: {scholarship.title}")
+                    row = scholarship_data.dict()
+                    row['title_hash'] = title_hash
+                    rows.append(row)
+                    # Skip repeats within the same batch as well
+                    existing_hashes.add(title_hash)
 
                 except Exception as e:
                     logger.error(
-                        f"Error saving scholarship {scholarship.title}: {e}")
-                    db.rollback()
+                        f"Error preparing scholarship {scholarship.title}: {e}")
                     continue
 
+            # Save to database in bounded multi-row inserts, one commit
+            for i in range(0, len(rows), batch_size):
+                db.execute(Scholarship.__table__.insert(),
+                           rows[i:i + batch_size])
+            db.commit()
+            saved_count = len(rows)
+
         except Exception as e:
             logger.error(f"Error saving scraped scholarships: {e}")
             db.rollback()
@@ -977,18 +1160,30 @@ class ScrapingService:
                 job.started_at = datetime.utcnow()
                 db.commit()
 
-                # Execute scraping
-                scholarships = await self.scrape_scholarships(
+                # Execute scraping, saving in bounded batches as pages arrive.
+                # Batches stay below the fuzzy dedup limit so near-duplicate
+                # detection always runs on this path.
+                stream_batch_size = min(settings.SCRAPING_STREAM_BATCH_SIZE,
+                                        settings.SCRAPING_FUZZY_DEDUP_MAX_BATCH - 1)
+                scraped_count = 0
+                saved_count = 0
+                batch = []
+                async for scholarship in self.iter_scholarships(
                     job.source_url, job.source_name, max_pages=10
-                )
+                ):
+                    scraped_count += 1
+                    batch.append(scholarship)
+                    if len(batch) >= stream_batch_size:
+                        saved_count += await self.save_scraped_scholarships(db, batch)
+                        batch = []
 
-                # Save scholarships
-                saved_count = await self.save_scraped_scholarships(db, scholarships)
+                if batch:
+                    saved_count += await self.save_scraped_scholarships(db, batch)
 
                 # Update job completion
                 job.status = 'completed'
                 job.completed_at = datetime.utcnow()
-                job.items_scraped = len(scholarships)
+                job.items_scraped = scraped_count
                 job.items_saved = saved_count
                 db.commit()
 
@@ -1005,46 +1200,52 @@ class ScrapingService:
 
                 raise
 
-    async def get_scraping_sources(self) -> List[Dict[str, Any]]:
+    async def get_scraping_sources(self, db: Optional[Session] = None) -> List[Dict[str, Any]]:
         """
         Get list of available scraping sources
         """
-        sources = []
-
-        for source_name, config in self.source_configs.items():
-            sources.append({
-                'name': source_name,
-                'url': f"https://{source_name}",
-                'description': f"Scholarships from {source_name}",
-                'supported_features': {
-                    'pagination': config.get('pagination', {}).get('enabled', False),
-                    'ai_extraction': True,
-                    'link_validation': True
-                },
-                'last_scraped': None,  # This would be fetched from database
-                'status': 'active'
-            })
+        last_scraped = {}
+        if db is not None:
+            try:
+                last_scraped = dict(
+                    db.query(ScrapingJob.source_name,
+                             func.max(ScrapingJob.completed_at))
+                    .group_by(ScrapingJob.source_name)
+                    .all()
+                )
+            except Exception as e:
+                logger.error(f"Error fetching last scraped times: {e}")
 
-        return sources
+        return [
+            {**source, 'last_scraped': last_scraped.get(source['name'])}
+            for source in self._static_sources
+        ]
 
     async def get_scraping_stats(self, db: Session) -> Dict[str, Any]:
         """
         Get scraping statistics
         """
         try:
-            total_jobs = db.query(ScrapingJob).count()
-            completed_jobs = db.query(ScrapingJob).filter(
-                ScrapingJob.status == 'completed').count()
-            failed_jobs = db.query(ScrapingJob).filter(
-                ScrapingJob.status == 'failed').count()
-            running_jobs = db.query(ScrapingJob).filter(
-                ScrapingJob.status == 'running').count()
-
-            total_scholarships = db.query(Scholarship).count()
-            active_scholarships = db.query(Scholarship).filter(
-                Scholarship.is_active == True).count()
-            verified_scholarships = db.query(Scholarship).filter(
-                Scholarship.is_verified == True).count()
+            # Job counts per status in one GROUP BY
+            job_counts = dict(
+                db.query(ScrapingJob.status, func.count(ScrapingJob.id))
+                .group_by(ScrapingJob.status)
+                .all()
+            )
+            total_jobs = sum(job_counts.values())
+            completed_jobs = job_counts.get('completed', 0)
+            failed_jobs = job_counts.get('failed', 0)
+            running_jobs = job_counts.get('running', 0)
+
+            # Scholarship counts in a single scan using FILTER clauses
+            scholarship_counts = db.query(
+                func.count(Scholarship.id),
+                func.count(Scholarship.id).filter(
+                    Scholarship.is_active == True),
+                func.count(Scholarship.id).filter(
+                    Scholarship.is_verified == True)
+            ).one()
+            total_scholarships, active_scholarships, verified_scholarships = scholarship_counts
 
             return {
                 'total_jobs': total_jobs,
@@ -1061,3 +1262,17 @@ class ScrapingService:
         except Exception as e:
             logger.error(f"Error getting scraping stats: {e}")
             raise
+
+
+# Per-process service shared by Celery tasks and cleanup pool workers
+_scraping_service: Optional[ScrapingService] = None
+
+
+def get_scraping_service(browser=None) -> ScrapingService:
+    """Get the shared scraping service instance, bound to `browser` if given."""
+    global _scraping_service
+    if _scraping_service is None:
+        _scraping_service = ScrapingService()
+    if browser is not None:
+        _scraping_service.browser = browser
+    return _scraping_service
@@ -2,23 +2,82 @@
 User service for handling user operations, authentication, and profile management.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Generator
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
-from fastapi import HTTPException, status
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+from sqlalchemy import and_, or_, desc, func, select, insert, update
+from fastapi import HTTPException, status, Depends
+import bcrypt
+import jwt
 import uuid
 import logging
+import hashlib
+from functools import lru_cache
+import hmac
+import os
+import time
+from contextlib import contextmanager
 from email_validator import validate_email, EmailNotValidError
 
 from ..models.models import User, Application, Bookmark, Review, ActivityLog, Notification
 from ..core.config import settings
-from ..core.database import get_db_session
+from ..core.database import get_db_session, get_db
+from ..schemas import ApplicationListItem, BookmarkListItem, ReviewListItem, NotificationListItem
 
 logger = logging.getLogger(__name__)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash_password(password: str) -> str:
+    """Hash a password with bcrypt."""
+    salt = bcrypt.gensalt(rounds=settings.SECURITY_BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def _verify_password(password: str, password_hash: str) -> bool:
+    """Check a password against a bcrypt hash."""
+    try:
+        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+    except ValueError:
+        # Not a bcrypt hash
+        return False
+
+
+# Short-lived cache of successful password checks so repeated logins within
+# the TTL skip the bcrypt KDF. Keyed by (user_id, password_hash) so a password
+# change invalidates entries; values are keyed HMACs, never the password.
+_VERIFY_CACHE_KEY = os.urandom(32)
+_verified_passwords: Dict[Tuple[str, str], Tuple[bytes, float]] = {}
+
+
+def _verify_password_cached(user_id: str, password: str, password_hash: str) -> bool:
+    """Verify a password, reusing a recent successful bcrypt check."""
+    ttl = settings.SECURITY_PASSWORD_VERIFY_CACHE_TTL
+    if ttl <= 0:
+        return _verify_password(password, password_hash)
+
+    key = (user_id, password_hash)
+    digest = hmac.new(_VERIFY_CACHE_KEY, password.encode("utf-8"),
+                      hashlib.sha256).digest()
+    now = time.monotonic()
+
+    cached = _verified_passwords.get(key)
+    if cached and cached[1] > now and hmac.compare_digest(cached[0], digest):
+        return True
+
+    if not _verify_password(password, password_hash):
+        return False
+
+    if len(_verified_passwords) >= settings.CACHE_MAX_ENTRIES:
+        # Drop the oldest entry (dicts keep insertion order)
+        _verified_passwords.pop(next(iter(_verified_passwords)), None)
+    _verified_passwords[key] = (digest, now + ttl)
+    return True
+
+
+@lru_cache(maxsize=10000)
+def _validate_email_cached(email: str) -> str:
+    """Syntax-only email validation, returning the normalized address."""
+    return validate_email(email, check_deliverability=False).normalized
 
 
 class UserService:
@@ -26,14 +85,15 @@ class UserService:
 
     def __init__(self, db: Session):
         self.db = db
+        # Activity logs recorded during this request, written by flush_activity_logs
+        self._activity_buffer: List[Dict[str, Any]] = []
 
     def create_user(self, user_data: Dict[str, Any]) -> User:
         """Create a new user with validation."""
         try:
             # Validate email format
             try:
-                valid_email = validate_email(user_data["email"])
-                email = valid_email.email
+                email = _validate_email_cached(user_data["email"])
             except EmailNotValidError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -53,10 +113,10 @@ class UserService:
                 )
 
             # Hash password
-            hashed_password = pwd_context.hash(user_data["password"])
+            hashed_password = _hash_password(user_data["password"])
 
-            # Create user
-            user = User(
+            # Create user, fetching the stored row in the same round-trip
+            user = self.db.execute(insert(User).values(
                 id=str(uuid.uuid4()),
                 username=user_data["username"],
                 email=email,
@@ -75,11 +135,9 @@ class UserService:
                 email_verified=False,
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow()
-            )
+            ).returning(User)).scalar_one()
 
-            self.db.add(user)
             self.db.commit()
-            self.db.refresh(user)
 
             # Log user creation
             self._log_activity(user.id, "USER_CREATED",
@@ -104,11 +162,16 @@ class UserService:
                 User.is_active == True
             ).first()
 
-            if not user or not pwd_context.verify(password, user.password_hash):
+            if not user or not _verify_password_cached(user.id, password, user.password_hash):
                 return None
 
-            # Update last login
-            user.last_login = datetime.utcnow()
+            # Update last login with a single UPDATE
+            self.db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .values(last_login=datetime.utcnow())
+            )
+
             self.db.commit()
 
             # Log successful login
@@ -139,7 +202,7 @@ class UserService:
             payload = jwt.decode(token, settings.SECRET_KEY,
                                  algorithms=[settings.ALGORITHM])
             return payload
-        except JWTError:
+        except jwt.InvalidTokenError:
             return None
 
     def get_user_by_id(self, user_id: str) -> Optional[User]:
@@ -171,12 +234,13 @@ class UserService:
                     setattr(user, field, update_data[field])
 
             user.updated_at = datetime.utcnow()
+
             self.db.commit()
-            self.db.refresh(user)
 
             # Log profile update
             self._log_activity(user_id, "PROFILE_UPDATED",
                                "User profile updated successfully")
+            self.db.refresh(user)
 
             return user
 
@@ -199,15 +263,16 @@ class UserService:
                 )
 
             # Verify current password
-            if not pwd_context.verify(current_password, user.password_hash):
+            if not _verify_password(current_password, user.password_hash):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Current password is incorrect"
                 )
 
             # Hash new password
-            user.password_hash = pwd_context.hash(new_password)
+            user.password_hash = _hash_password(new_password)
             user.updated_at = datetime.utcnow()
+
             self.db.commit()
 
             # Log password change
@@ -235,6 +300,7 @@ class UserService:
             # For now, we'll just mark as verified
             user.email_verified = True
             user.updated_at = datetime.utcnow()
+
             self.db.commit()
 
             # Log email verification
@@ -248,41 +314,55 @@ class UserService:
             logger.error(f"Error verifying email: {str(e)}")
             return False
 
-    def get_user_applications(self, user_id: str, limit: int = 10, offset: int = 0) -> List[Application]:
+    def get_user_applications(self, user_id: str, limit: int = 10, offset: int = 0) -> List[ApplicationListItem]:
         """Get user's scholarship applications."""
-        return self.db.query(Application)\
-            .filter(Application.user_id == user_id)\
+        rows = self.db.query(
+            Application.id, Application.scholarship_id, Application.status,
+            Application.tracking_id, Application.submitted_at,
+            Application.created_at, Application.updated_at
+        ).filter(Application.user_id == user_id)\
             .order_by(desc(Application.created_at))\
             .limit(limit)\
             .offset(offset)\
             .all()
+        return [ApplicationListItem.from_row(row) for row in rows]
 
-    def get_user_bookmarks(self, user_id: str, limit: int = 10, offset: int = 0) -> List[Bookmark]:
+    def get_user_bookmarks(self, user_id: str, limit: int = 10, offset: int = 0) -> List[BookmarkListItem]:
         """Get user's bookmarked scholarships."""
-        return self.db.query(Bookmark)\
-            .filter(Bookmark.user_id == user_id)\
+        rows = self.db.query(
+            Bookmark.id, Bookmark.scholarship_id, Bookmark.notes,
+            Bookmark.reminder_date, Bookmark.created_at
+        ).filter(Bookmark.user_id == user_id)\
             .order_by(desc(Bookmark.created_at))\
             .limit(limit)\
             .offset(offset)\
             .all()
+        return [BookmarkListItem.from_row(row) for row in rows]
 
-    def get_user_reviews(self, user_id: str, limit: int = 10, offset: int = 0) -> List[Review]:
+    def get_user_reviews(self, user_id: str, limit: int = 10, offset: int = 0) -> List[ReviewListItem]:
         """Get user's scholarship reviews."""
-        return self.db.query(Review)\
-            .filter(Review.user_id == user_id)\
+        rows = self.db.query(
+            Review.id, Review.scholarship_id, Review.rating, Review.comment,
+            Review.status, Review.is_published, Review.created_at
+        ).filter(Review.user_id == user_id)\
             .order_by(desc(Review.created_at))\
             .limit(limit)\
             .offset(offset)\
             .all()
+        return [ReviewListItem.from_row(row) for row in rows]
 
-    def get_user_notifications(self, user_id: str, limit: int = 20, offset: int = 0) -> List[Notification]:
+    def get_user_notifications(self, user_id: str, limit: int = 20, offset: int = 0) -> List[NotificationListItem]:
         """Get user's notifications."""
-        return self.db.query(Notification)\
-            .filter(Notification.user_id == user_id)\
+        rows = self.db.query(
+            Notification.id, Notification.type, Notification.title,
+            Notification.message, Notification.category, Notification.priority,
+            Notification.is_read, Notification.created_at
+        ).filter(Notification.user_id == user_id)\
             .order_by(desc(Notification.created_at))\
             .limit(limit)\
             .offset(offset)\
             .all()
+        return [NotificationListItem.from_row(row) for row in rows]
 
     def mark_notification_read(self, user_id: str, notification_id: str) -> bool:
         """Mark a notification as read."""
@@ -317,23 +397,27 @@ class UserService:
              .group_by(Application.status)\
              .all()
 
-            # Get bookmark count
-            bookmark_count = self.db.query(func.count(Bookmark.id))\
-                .filter(Bookmark.user_id == user_id)\
-                .scalar()
-
-            # Get unread notification count
-            unread_notifications = self.db.query(func.count(Notification.id))\
-                .filter(
+            # Get bookmark and unread notification counts in one round-trip
+            counts = self.db.execute(select(
+                select(func.count(Bookmark.id))
+                .where(Bookmark.user_id == user_id)
+                .scalar_subquery()
+                .label('bookmark_count'),
+                select(func.count(Notification.id))
+                .where(
                     Notification.user_id == user_id,
                     Notification.is_read == False
-            )\
-                .scalar()
+                )
+                .scalar_subquery()
+                .label('unread_notifications')
+            )).one()
+            bookmark_count = counts.bookmark_count
+            unread_notifications = counts.unread_notifications
 
             # Get recent activity
             recent_activity = self.db.query(ActivityLog)\
                 .filter(ActivityLog.user_id == user_id)\
-                .order_by(desc(ActivityLog.created_at))\
+                .order_by(desc(ActivityLog.timestamp))\
                 .limit(10)\
                 .all()
 
@@ -345,8 +429,8 @@ class UserService:
                     {
                         "id": activity.id,
                         "action": activity.action,
-                        "description": activity.description,
-                        "created_at": activity.created_at.isoformat()
+                        "description": (activity.details or {}).get("description"),
+                        "created_at": activity.timestamp.isoformat()
                     }
                     for activity in recent_activity
                 ]
@@ -365,6 +449,7 @@ class UserService:
 
             user.is_active = False
             user.updated_at = datetime.utcnow()
+
             self.db.commit()
 
             # Log account deactivation
@@ -379,30 +464,64 @@ class UserService:
             return False
 
     def _log_activity(self, user_id: str, action: str, description: str):
-        """Log user activity."""
+        """
+        Buffer user activity for a single bulk insert at request end.
+
+        Callers log only after their own commit, so a logged action has
+        always happened.
+        """
+        self._activity_buffer.append({
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "action": action,
+            "resource": "user",
+            "resource_id": user_id,
+            "details": {"description": description},
+            "ip_address": None,  # Will be populated from request
+            "user_agent": None,  # Will be populated from request
+            "success": True,
+            "timestamp": datetime.utcnow()
+        })
+
+    def flush_activity_logs(self):
+        """
+        Write buffered activity logs with one INSERT and commit them.
+
+        A logging failure is logged and rolled back; it never reaches the
+        caller, whose own work is already committed.
+        """
+        if not self._activity_buffer:
+            return
+
+        rows, self._activity_buffer = self._activity_buffer, []
         try:
-            activity = ActivityLog(
-                id=str(uuid.uuid4()),
-                user_id=user_id,
-                action=action,
-                description=description,
-                ip_address="",  # Will be populated from request
-                user_agent="",  # Will be populated from request
-                created_at=datetime.utcnow()
-            )
-
-            self.db.add(activity)
+            self.db.execute(ActivityLog.__table__.insert(), rows)
             self.db.commit()
-
         except Exception as e:
+            self.db.rollback()
             logger.error(f"Error logging activity: {str(e)}")
-            # Don't raise exception as this is just logging
 
 # Helper function to get user service instance
 
 
-def get_user_service(db: Session = None) -> UserService:
-    """Get user service instance."""
-    if db is None:
-        db = next(get_db_session())
-    return UserService(db)
+@contextmanager
+def get_user_service(db: Session = None) -> Generator[UserService, None, None]:
+    """Get user service instance, on a new session unless one is given."""
+    if db is not None:
+        yield UserService(db)
+        return
+    with get_db_session() as db:
+        service = UserService(db)
+        try:
+            yield service
+        finally:
+            service.flush_activity_logs()
+
+
+def user_service_dependency(db: Session = Depends(get_db)) -> Generator[UserService, None, None]:
+    """FastAPI dependency that flushes buffered activity logs after the request."""
+    service = UserService(db)
+    try:
+        yield service
+    finally:
+        service.flush_activity_logs()
@@ -2,19 +2,227 @@
 Validation service for link validation, quality scoring, and content verification.
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from datetime import datetime, timedelta
 import asyncio
-import aiohttp
+import hashlib
+import httpx
 import logging
-from urllib.parse import urlparse, urljoin
-from dataclasses import dataclass
+import time
+from urllib.parse import urlparse, urlunparse, urljoin
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 import re
 from enum import Enum
 
+from app.core.cache import cache
+from app.core.config import settings
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
 
+def _compile_hyperscan(expressions) -> Optional[Any]:
+    """Compile case-insensitive patterns into a Hyperscan database.
+
+    Returns None when Hyperscan is not installed; callers then fall back to
+    the equivalent ``re`` pattern. Pattern ids are the expression indexes,
+    and each pattern is reported at most once per scan.
+    """
+    if hyperscan is None:
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[e.encode() for e in expressions],
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+    )
+    return database
+
+
+def _collect_match_id(match_id, start, end, flags, context):
+    """Hyperscan match handler collecting pattern ids into a list."""
+    context.append(match_id)
+
+# Suspicious URL patterns, combined into one alternation so a URL is scanned
+# once instead of once per pattern. Each pattern gets its own group so the
+# match can be mapped back to the pattern that produced it.
+_SUSPICIOUS_PATTERNS = (
+    r'bit\.ly',
+    r'tinyurl\.com',
+    r'goo\.gl',
+    r't\.co',
+    r'shorturl\.at',
+    r'click\.here',
+    r'download\.now',
+    r'free\.money',
+    r'guaranteed\.scholarship',
+    r'100%\.scholarship',
+    r'no\.application\.fee',
+    r'instant\.approval'
+)
+_SUSPICIOUS_URL_RE = re.compile(
+    "|".join(f"({p})" for p in _SUSPICIOUS_PATTERNS), re.IGNORECASE)
+_SUSPICIOUS_URL_HS = _compile_hyperscan(_SUSPICIOUS_PATTERNS)
+_SUSPICIOUS_PATTERN_ISSUES = tuple(
+    f"Suspicious pattern detected: {p}" for p in _SUSPICIOUS_PATTERNS)
+
+
+def _suspicious_pattern_ids(url: str) -> List[int]:
+    """Indexes into _SUSPICIOUS_PATTERNS of the patterns found in a URL."""
+    ids: List[int] = []
+    if _SUSPICIOUS_URL_HS is not None:
+        _SUSPICIOUS_URL_HS.scan(url.encode('utf-8', 'replace'),
+                                match_event_handler=_collect_match_id, context=ids)
+        return ids
+
+    for match in _SUSPICIOUS_URL_RE.finditer(url):
+        index = match.lastindex - 1
+        if index not in ids:
+            ids.append(index)
+    return ids
+
+# Suspicious phrases looked for in page content
+_SUSPICIOUS_CONTENT = (
+    'click here to download',
+    'guaranteed scholarship',
+    'no application fee',
+    'instant approval',
+    'limited time offer'
+)
+_SUSPICIOUS_CONTENT_ISSUES = tuple(
+    (p, f"Suspicious content: {p}") for p in _SUSPICIOUS_CONTENT)
+
+# Trusted domains for scholarship sources
+_TRUSTED_DOMAINS = frozenset((
+    'scholarships.gov.in',
+    'nsp.gov.in',
+    'ugc.ac.in',
+    'aicte-india.org',
+    'dst.gov.in',
+    'csir.res.in',
+    'icmr.gov.in',
+    'dbt.gov.in',
+    'icar.org.in',
+    'indianrailways.gov.in',
+    'pfms.nic.in',
+    'aiims.edu',
+    'iit.ac.in',
+    'iisc.ac.in',
+    'bits-pilani.ac.in',
+    'gov.in',
+    'nic.in',
+    'edu'
+))
+
+
+def _build_domain_trie(domains) -> Dict[str, Any]:
+    """Build a trie keyed by reversed domain labels ('a.gov.in' -> in/gov/a)."""
+    trie: Dict[str, Any] = {}
+    for domain in domains:
+        node = trie
+        for label in reversed(domain.split('.')):
+            node = node.setdefault(label, {})
+        node[''] = True
+    return trie
+
+
+_TRUSTED_DOMAIN_TRIE = _build_domain_trie(_TRUSTED_DOMAINS)
+
+# Fallback suffix tiers; str.endswith checks a whole tuple in one call
+_GOV_SUFFIXES = ('.gov.in', '.gov')
+_EDU_SUFFIXES = ('.edu', '.ac.in')
+_ORG_SUFFIXES = ('.org',)
+_COM_SUFFIXES = ('.com', '.in')
+
+
+@lru_cache(maxsize=4096)
+def _domain_trust_score(domain: str) -> float:
+    """Trust score for a lowercased host name."""
+    labels = domain.split('.')
+
+    # Walk the trusted-domain trie from the TLD; a terminal node before the
+    # last label is a subdomain match, on the last label an exact match
+    node = _TRUSTED_DOMAIN_TRIE
+    subdomain_match = False
+    for depth, label in enumerate(reversed(labels), 1):
+        node = node.get(label)
+        if node is None:
+            break
+        if '' in node:
+            if depth == len(labels):
+                return 100.0
+            subdomain_match = True
+    if subdomain_match:
+        return 95.0
+
+    # Government domains
+    if domain.endswith(_GOV_SUFFIXES):
+        return 90.0
+
+    # Educational domains
+    if domain.endswith(_EDU_SUFFIXES):
+        return 85.0
+
+    # Organization domains
+    if domain.endswith(_ORG_SUFFIXES):
+        return 75.0
+
+    # Commercial domains
+    if domain.endswith(_COM_SUFFIXES):
+        return 60.0
+
+    return 40.0
+
+
+# Keyword lists used for content scoring
+_SCHOLARSHIP_KEYWORDS = frozenset((
+    'scholarship', 'fellowship', 'grant', 'financial aid', 'education',
+    'student', 'application', 'eligibility', 'criteria', 'deadline'
+))
+_PROCESS_KEYWORDS = frozenset((
+    'apply', 'application form', 'submit', 'documents', 'requirements',
+    'how to apply', 'selection process', 'merit', 'interview'
+))
+_SPAM_KEYWORDS = frozenset((
+    'click here', 'act now', 'limited time', 'guaranteed', 'instant',
+    'free money', 'no fee', 'easy money', 'work from home'
+))
+_PROMOTIONAL_KEYWORDS = frozenset((
+    'guaranteed', 'instant', 'free money', 'no fee', 'easy money'
+))
+_MARKER_KEYWORDS = frozenset(('eligibility', 'deadline', 'last date'))
+
+# All content keywords in one lookahead alternation (longest first) so a
+# single scan finds every keyword, including ones that overlap. Only the
+# longest keyword starting at a position is reported, so each keyword also
+# implies the shorter keywords it begins with (e.g. 'application form'
+# implies 'application'). The keywords are ASCII, so the pattern runs on the
+# raw body bytes and the page is never decoded.
+_CONTENT_KEYWORDS = (_SCHOLARSHIP_KEYWORDS | _PROCESS_KEYWORDS | _SPAM_KEYWORDS
+                     | _MARKER_KEYWORDS | frozenset(_SUSPICIOUS_CONTENT))
+_CONTENT_KEYWORD_RE = re.compile(
+    b"(?=(" + b"|".join(re.escape(k.encode()) for k in sorted(_CONTENT_KEYWORDS, key=len, reverse=True)) + b"))",
+    re.IGNORECASE)
+_KEYWORD_PREFIXES = {
+    keyword.encode(): frozenset(k for k in _CONTENT_KEYWORDS if keyword.startswith(k))
+    for keyword in _CONTENT_KEYWORDS
+}
+
+# Hyperscan reports every keyword independently, overlaps included
+_CONTENT_KEYWORD_LIST = tuple(sorted(_CONTENT_KEYWORDS))
+_CONTENT_KEYWORD_HS = _compile_hyperscan([re.escape(k) for k in _CONTENT_KEYWORD_LIST])
+
+# Content score used when the body was not downloaded (HEAD checks, PDFs etc.)
+_UNINSPECTED_CONTENT_SCORE = 70.0
+
+
 class LinkStatus(str, Enum):
     VALID = "valid"
     INVALID = "invalid"
@@ -25,7 +233,7 @@ class LinkStatus(str, Enum):
     BLOCKED = "blocked"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of link validation."""
     url: str
@@ -41,61 +249,212 @@ class ValidationResult:
     validated_at: datetime
 
 
+def _result_to_cache(result: ValidationResult) -> Dict[str, Any]:
+    """JSON-safe form of a result for the shared cache."""
+    data = asdict(result)
+    data['status'] = result.status.value
+    data['validated_at'] = result.validated_at.isoformat()
+    return data
+
+
+def _result_from_cache(data: Dict[str, Any]) -> ValidationResult:
+    """Rebuild a result stored by _result_to_cache."""
+    data = dict(data)
+    data['status'] = LinkStatus(data['status'])
+    data['validated_at'] = datetime.fromisoformat(data['validated_at'])
+    return ValidationResult(**data)
+
+
+@dataclass(slots=True)
+class ContentAnalysis:
+    """Quality score, issues and suspicion flag from one pass over content."""
+    quality_score: float
+    issues: List[str]
+    suspicious: bool
+
+
 class LinkValidationService:
     """Service for validating links and scoring content quality."""
 
     def __init__(self):
-        self.timeout = aiohttp.ClientTimeout(total=30, connect=10)
+        # Unreachable hosts fail fast on connect; slow responses still get
+        # the full read timeout so they can be classified as SLOW
+        self.timeout = httpx.Timeout(
+            float(settings.VALIDATION_TIMEOUT_SECONDS),
+            connect=settings.VALIDATION_CONNECT_TIMEOUT_SECONDS
+        )
+        self._session: Optional[httpx.AsyncClient] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Recent results keyed by (normalized URL, fetch_content), LRU order
+        self._result_cache: "OrderedDict[Tuple[str, bool], Tuple[float, ValidationResult]]" = OrderedDict()
         self.headers = {
             'User-Agent': 'ShikshaSetu-Bot/1.0 (Scholarship Portal Link Validator)',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
 
         # Trusted domains for scholarship sources
-        self.trusted_domains = {
-            'scholarships.gov.in',
-            'nsp.gov.in',
-            'ugc.ac.in',
-            'aicte-india.org',
-            'dst.gov.in',
-            'csir.res.in',
-            'icmr.gov.in',
-            'dbt.gov.in',
-            'icar.org.in',
-            'indianrailways.gov.in',
-            'pfms.nic.in',
-            'aiims.edu',
-            'iit.ac.in',
-            'iisc.ac.in',
-            'bits-pilani.ac.in',
-            'gov.in',
-            'nic.in',
-            'edu'
-        }
+        self.trusted_domains = _TRUSTED_DOMAINS
+
+    async def _ensure_session(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        With HTTP/2 enabled, requests to the same host are multiplexed over
+        one connection. The client's pool is bound to the event loop it was
+        created on, so a new one is opened when the service is used from a
+        different loop. Celery workers run all tasks on one persistent loop
+        and so share a single client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.is_closed or self._session_loop is not loop:
+            self._session = httpx.AsyncClient(
+                http2=settings.VALIDATION_HTTP2,
+                timeout=self.timeout,
+                headers=self.headers,
+                limits=httpx.Limits(
+                    max_connections=settings.VALIDATION_POOL_SIZE,
+                    max_keepalive_connections=settings.VALIDATION_POOL_SIZE // 2,
+                    keepalive_expiry=60
+                )
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP client."""
+        if self._session is not None and not self._session.is_closed:
+            await self._session.aclose()
+        self._session = None
+        self._session_loop = None
+
+    @staticmethod
+    def _is_text_content(content_type: str) -> bool:
+        """Check whether a response body is worth scanning for keywords."""
+        if not content_type:
+            return True
+        content_type = content_type.lower()
+        return 'text/' in content_type or 'xml' in content_type or 'json' in content_type
+
+    async def _read_content(self, response: httpx.Response) -> bytes:
+        """Read at most VALIDATION_MAX_CONTENT_BYTES of the response body.
+
+        The body is kept as bytes; keyword scanning works on ASCII keywords
+        and never needs the decoded text.
+        """
+        limit = settings.VALIDATION_MAX_CONTENT_BYTES
+        buf = bytearray()
+        async for chunk in response.aiter_bytes(8192):
+            buf.extend(chunk)
+            if len(buf) >= limit:
+                break
+        return bytes(buf[:limit])
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Normalize a URL for caching: lowercase host, drop the fragment."""
+        parsed = urlparse(url)
+        return urlunparse(parsed._replace(netloc=parsed.netloc.lower(), fragment=''))
+
+    async def validate_url(self, url: str, fetch_content: bool = True) -> ValidationResult:
+        """Validate a single URL and return validation result.
+
+        With ``fetch_content=False`` only a HEAD request is made, which is
+        enough for uptime re-checks of links that were already scored.
+        Results that got an HTTP response are reused for
+        VALIDATION_RESULT_CACHE_TTL seconds in this process and for
+        VALIDATION_SHARED_CACHE_TTL seconds across workers through Redis,
+        since listings often repeat the same destination URL.
+        """
+        keys = self._cache_keys(url, fetch_content)
+        if keys is None:
+            return await self._validate_url(url, fetch_content)
+        key, shared_key = keys
+
+        result = self._cached_locally(key)
+        if result is not None:
+            return result
+
+        # The Redis client is synchronous; keep its round trip off the loop
+        shared_data = None
+        if shared_key is not None:
+            shared_data = await asyncio.to_thread(cache.get, shared_key)
+        return await self._validate_with_shared(url, fetch_content, key, shared_key, shared_data)
+
+    def _cache_keys(self, url: str, fetch_content: bool) -> Optional[Tuple[Tuple[str, bool], Optional[str]]]:
+        """Return the (local key, shared key) for a URL.
+
+        None means the URL is not cached at all; the shared key is None when
+        only the in-process cache is enabled.
+        """
+        local_ttl = settings.VALIDATION_RESULT_CACHE_TTL
+        shared_ttl = settings.VALIDATION_SHARED_CACHE_TTL
+        if local_ttl <= 0 and shared_ttl <= 0:
+            return None
 
-        # Suspicious patterns
-        self.suspicious_patterns = [
-            r'bit\.ly',
-            r'tinyurl\.com',
-            r'goo\.gl',
-            r't\.co',
-            r'shorturl\.at',
-            r'click\.here',
-            r'download\.now',
-            r'free\.money',
-            r'guaranteed\.scholarship',
-            r'100%\.scholarship',
-            r'no\.application\.fee',
-            r'instant\.approval'
-        ]
-
-    async def validate_url(self, url: str) -> ValidationResult:
-        """Validate a single URL and return validation result."""
+        try:
+            normalized = self._normalize_url(url)
+        except ValueError:
+            return None
+
+        shared_key = None
+        if shared_ttl > 0:
+            digest = hashlib.sha256(normalized.encode()).hexdigest()
+            shared_key = f"{settings.VALIDATION_SHARED_CACHE_PREFIX}:{digest}:{int(fetch_content)}"
+        return (normalized, fetch_content), shared_key
+
+    def _cached_locally(self, key: Tuple[str, bool]) -> Optional[ValidationResult]:
+        """Return an unexpired result from the in-process cache."""
+        if settings.VALIDATION_RESULT_CACHE_TTL <= 0:
+            return None
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return cached[1]
+
+    async def _validate_with_shared(self, url: str, fetch_content: bool, key: Tuple[str, bool],
+                                    shared_key: Optional[str], shared_data: Any) -> ValidationResult:
+        """Use the shared cache entry if there is one, else validate and store."""
+        now = time.monotonic()
+        if shared_data is not None:
+            try:
+                result = _result_from_cache(shared_data)
+            except (KeyError, TypeError, ValueError):
+                logger.warning(f"Discarding malformed cached validation for {url}")
+            else:
+                self._remember(key, now, result)
+                return result
+
+        result = await self._validate_url(url, fetch_content)
+
+        # Connection errors and timeouts are transient; only cache responses
+        if result.response_code:
+            self._remember(key, now, result)
+            if shared_key is not None:
+                await asyncio.to_thread(cache.set, shared_key, _result_to_cache(result),
+                                        settings.VALIDATION_SHARED_CACHE_TTL)
+
+        return result
+
+    def _remember(self, key: Tuple[str, bool], now: float, result: ValidationResult):
+        """Store a result in the in-process LRU cache."""
+        ttl = settings.VALIDATION_RESULT_CACHE_TTL
+        if ttl <= 0:
+            return
+        self._result_cache[key] = (now + ttl, result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > settings.VALIDATION_RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
+    async def _validate_url(self, url: str, fetch_content: bool) -> ValidationResult:
+        """Validate a single URL without consulting the result cache."""
         start_time = datetime.utcnow()
+        started = time.monotonic()
 
         try:
             # Basic URL validation
@@ -117,105 +476,132 @@ class LinkValidationService:
 
             # Check for suspicious patterns
             issues = []
-            for pattern in self.suspicious_patterns:
-                if re.search(pattern, url, re.IGNORECASE):
-                    issues.append(f"Suspicious pattern detected: {pattern}")
+            for index in _suspicious_pattern_ids(url):
+                issues.append(_SUSPICIOUS_PATTERN_ISSUES[index])
+
+            session = await self._ensure_session()
+            try:
+                response = await session.send(
+                    session.build_request('GET' if fetch_content else 'HEAD', url),
+                    stream=True, follow_redirects=True)
+                if not fetch_content and response.status_code in (405, 501):
+                    # Server does not support HEAD
+                    await response.aclose()
+                    response = await session.send(
+                        session.build_request('GET', url), stream=True, follow_redirects=True)
 
-            async with aiohttp.ClientSession(
-                timeout=self.timeout,
-                headers=self.headers
-            ) as session:
                 try:
-                    async with session.get(url, allow_redirects=True) as response:
-                        response_time = (datetime.utcnow() -
-                                         start_time).total_seconds()
+                    response_time = time.monotonic() - started
 
-                        # Get response details
-                        content_type = response.headers.get('content-type', '')
+                    # Get response details
+                    content_type = response.headers.get('content-type', '')
+                    try:
                         content_length = int(
                             response.headers.get('content-length', 0))
-                        final_url = str(response.url)
-
-                        # Read content for analysis
-                        content = await response.text()
-
-                        # Determine status
-                        status = self._determine_status(
-                            response.status, response_time, final_url, content)
-
-                        # Calculate quality score
-                        quality_score = self._calculate_quality_score(
-                            url, final_url, content, content_type, response.status, response_time
-                        )
-
-                        # Additional checks
-                        if response.status >= 400:
-                            issues.append(f"HTTP error: {response.status}")
-
-                        if response_time > 10:
-                            issues.append("Slow response time")
-
-                        if final_url != url:
-                            issues.append("URL redirected")
-
-                        # Check content quality
-                        content_issues = self._check_content_quality(content)
-                        issues.extend(content_issues)
-
-                        return ValidationResult(
-                            url=url,
-                            status=status,
-                            response_code=response.status,
-                            response_time=response_time,
-                            final_url=final_url,
-                            content_type=content_type,
-                            content_length=content_length,
-                            quality_score=quality_score,
-                            issues=issues,
-                            metadata={
-                                'server': response.headers.get('server', ''),
-                                'last_modified': response.headers.get('last-modified', ''),
-                                'content_encoding': response.headers.get('content-encoding', ''),
-                                'cache_control': response.headers.get('cache-control', ''),
-                                'redirects': len(response.history) if hasattr(response, 'history') else 0
-                            },
-                            validated_at=start_time
-                        )
-
-                except aiohttp.ClientError as e:
-                    logger.error(
-                        f"Client error validating URL {url}: {str(e)}")
-                    return ValidationResult(
-                        url=url,
-                        status=LinkStatus.BROKEN,
-                        response_code=0,
-                        response_time=(datetime.utcnow() -
-                                       start_time).total_seconds(),
-                        final_url=url,
-                        content_type="",
-                        content_length=0,
-                        quality_score=0.0,
-                        issues=[f"Connection error: {str(e)}"],
-                        metadata={},
-                        validated_at=start_time
+                    except ValueError:
+                        content_length = 0
+                    # Only stringify the final URL when a redirect happened;
+                    # otherwise it is the URL we requested
+                    redirected = bool(response.history)
+                    final_url = str(response.url) if redirected else url
+
+                    # Read a bounded prefix of textual content for analysis;
+                    # None means the body was not inspected
+                    content = None
+                    oversized = False
+                    if fetch_content and self._is_text_content(content_type):
+                        # A page declaring a huge body is not read at all
+                        if content_length > settings.VALIDATION_MAX_RESPONSE_BYTES:
+                            oversized = True
+                            issues.append("Response too large")
+                        else:
+                            content = await self._read_content(response)
+
+                    # Analyze content once for score, issues and suspicion
+                    analysis = self._analyze_content(
+                        content) if content is not None else None
+
+                    # Determine status
+                    status = self._determine_status(
+                        response.status_code, response_time, final_url,
+                        oversized or (analysis is not None and analysis.suspicious))
+
+                    # Calculate quality score
+                    quality_score = self._calculate_quality_score(
+                        url, final_url,
+                        analysis.quality_score if analysis is not None else None,
+                        content_type, response.status_code, response_time,
+                        domain=response.url.host
                     )
 
-                except asyncio.TimeoutError:
-                    logger.error(f"Timeout validating URL {url}")
+                    # Additional checks
+                    if response.status_code >= 400:
+                        issues.append(f"HTTP error: {response.status_code}")
+
+                    if response_time > 10:
+                        issues.append("Slow response time")
+
+                    if redirected:
+                        issues.append("URL redirected")
+
+                    # Check content quality
+                    if analysis is not None:
+                        issues.extend(analysis.issues)
+
                     return ValidationResult(
                         url=url,
-                        status=LinkStatus.SLOW,
-                        response_code=0,
-                        response_time=(datetime.utcnow() -
-                                       start_time).total_seconds(),
-                        final_url=url,
-                        content_type="",
-                        content_length=0,
-                        quality_score=0.0,
-                        issues=["Request timeout"],
-                        metadata={},
+                        status=status,
+                        response_code=response.status_code,
+                        response_time=response_time,
+                        final_url=final_url,
+                        content_type=content_type,
+                        content_length=content_length,
+                        quality_score=quality_score,
+                        issues=issues,
+                        metadata={
+                            'server': response.headers.get('server', ''),
+                            'last_modified': response.headers.get('last-modified', ''),
+                            'content_encoding': response.headers.get('content-encoding', ''),
+                            'cache_control': response.headers.get('cache-control', ''),
+                            'redirects': len(response.history)
+                        },
                         validated_at=start_time
                     )
+                finally:
+                    await response.aclose()
+
+            except httpx.TimeoutException:
+                logger.error(f"Timeout validating URL {url}")
+                return ValidationResult(
+                    url=url,
+                    status=LinkStatus.SLOW,
+                    response_code=0,
+                    response_time=time.monotonic() - started,
+                    final_url=url,
+                    content_type="",
+                    content_length=0,
+                    quality_score=0.0,
+                    issues=["Request timeout"],
+                    metadata={},
+                    validated_at=start_time
+                )
+
+            except httpx.HTTPError as e:
+                logger.error(
+                    f"Client error validating URL {url}: {str(e)}")
+                return ValidationResult(
+                    url=url,
+                    status=LinkStatus.BROKEN,
+                    response_code=0,
+                    response_time=time.monotonic() - started,
+                    final_url=url,
+                    content_type="",
+                    content_length=0,
+                    quality_score=0.0,
+                    issues=[f"Connection error: {str(e)}"],
+                    metadata={},
+                    validated_at=start_time
+                )
 
         except Exception as e:
             logger.error(f"Unexpected error validating URL {url}: {str(e)}")
@@ -223,7 +609,7 @@ class LinkValidationService:
                 url=url,
                 status=LinkStatus.INVALID,
                 response_code=0,
-                response_time=(datetime.utcnow() - start_time).total_seconds(),
+                response_time=time.monotonic() - started,
                 final_url=url,
                 content_type="",
                 content_length=0,
@@ -233,26 +619,83 @@ class LinkValidationService:
                 validated_at=start_time
             )
 
-    async def validate_urls_batch(self, urls: List[str], batch_size: int = 10) -> List[ValidationResult]:
-        """Validate multiple URLs in batches."""
-        results = []
+    @staticmethod
+    def _find_keywords(content: bytes) -> set:
+        """Return the set of content keywords present in a body (any case).
 
-        for i in range(0, len(urls), batch_size):
-            batch = urls[i:i + batch_size]
-            batch_results = await asyncio.gather(
-                *[self.validate_url(url) for url in batch],
-                return_exceptions=True
-            )
+        Matching is case-insensitive, so only the short matched keyword is
+        lowercased rather than the whole page.
+        """
+        if _CONTENT_KEYWORD_HS is not None:
+            ids: List[int] = []
+            _CONTENT_KEYWORD_HS.scan(content, match_event_handler=_collect_match_id, context=ids)
+            return {_CONTENT_KEYWORD_LIST[i] for i in ids}
 
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Error in batch validation: {str(result)}")
-                else:
-                    results.append(result)
+        found = set()
+        for match in _CONTENT_KEYWORD_RE.finditer(content):
+            found.update(_KEYWORD_PREFIXES[match.group(1).lower()])
+        return found
+
+    async def validate_urls_batch(self, urls: List[str], batch_size: int = 10) -> List[ValidationResult]:
+        """Validate multiple URLs with at most ``batch_size`` requests in flight.
+
+        A semaphore bounds concurrency instead of fixed batches, so one slow
+        host no longer holds up the rest of its batch.
+        """
+        results = await self.validate_urls(urls, concurrency=batch_size)
+        return [result for result in results if result is not None]
+
+    async def validate_urls(self, urls: List[str], concurrency: Optional[int] = None,
+                            fetch_content: bool = True,
+                            on_done: Optional[Callable[[], None]] = None) -> List[Optional[ValidationResult]]:
+        """Validate URLs concurrently over the shared client.
+
+        Results are returned in input order, with None for URLs whose
+        validation raised. ``on_done`` is called after each URL finishes,
+        e.g. to report task progress.
+        """
+        semaphore = asyncio.Semaphore(
+            concurrency or settings.VALIDATION_CONCURRENCY)
+
+        # Look up every shared cache entry with one MGET up front rather
+        # than one blocking round trip per URL inside the fan-out
+        url_keys = [self._cache_keys(url, fetch_content) for url in urls]
+        shared_keys = list({
+            keys[1] for keys in url_keys
+            if keys is not None and keys[1] is not None and self._cached_locally(keys[0]) is None
+        })
+        shared = {}
+        if shared_keys:
+            shared = dict(zip(shared_keys, await asyncio.to_thread(cache.get_many, shared_keys)))
+
+        async def _validate(url: str, keys) -> ValidationResult:
+            try:
+                async with semaphore:
+                    if keys is None:
+                        return await self._validate_url(url, fetch_content)
+                    key, shared_key = keys
+                    result = self._cached_locally(key)
+                    if result is not None:
+                        return result
+                    return await self._validate_with_shared(
+                        url, fetch_content, key, shared_key, shared.get(shared_key))
+            finally:
+                if on_done is not None:
+                    on_done()
+
+        results = []
+        tasks = [_validate(url, keys) for url, keys in zip(urls, url_keys)]
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error in batch validation: {str(result)}")
+                results.append(None)
+            else:
+                results.append(result)
 
         return results
 
-    def _determine_status(self, status_code: int, response_time: float, final_url: str, content: str) -> LinkStatus:
+    def _determine_status(self, status_code: int, response_time: float, final_url: str,
+                          content_suspicious: bool) -> LinkStatus:
         """Determine the link status based on response."""
         if status_code >= 400:
             return LinkStatus.BROKEN
@@ -260,7 +703,7 @@ class LinkValidationService:
         if response_time > 10:
             return LinkStatus.SLOW
 
-        if self._is_suspicious_content(content):
+        if content_suspicious:
             return LinkStatus.SUSPICIOUS
 
         if status_code in [301, 302, 303, 307, 308]:
@@ -268,13 +711,21 @@ class LinkValidationService:
 
         return LinkStatus.VALID
 
-    def _calculate_quality_score(self, original_url: str, final_url: str, content: str,
-                                 content_type: str, status_code: int, response_time: float) -> float:
-        """Calculate quality score for the link."""
+    def _calculate_quality_score(self, original_url: str, final_url: str, content_score: Optional[float],
+                                 content_type: str, status_code: int, response_time: float,
+                                 domain: Optional[str] = None) -> float:
+        """Calculate quality score for the link.
+
+        ``content_score`` is None when the body was not inspected. ``domain``
+        is the already-parsed host of ``final_url``; it is only parsed here
+        when the caller does not have it.
+        """
         score = 100.0
 
         # Domain trust score
-        domain_score = self._get_domain_trust_score(final_url)
+        if domain is None:
+            domain = urlparse(final_url).hostname or ''
+        domain_score = self._get_domain_trust_score(domain)
         score = score * (domain_score / 100.0)
 
         # HTTP status penalty
@@ -290,7 +741,8 @@ class LinkValidationService:
             score *= 0.8
 
         # Content quality score
-        content_score = self._get_content_quality_score(content)
+        if content_score is None:
+            content_score = _UNINSPECTED_CONTENT_SCORE
         score = score * (content_score / 100.0)
 
         # Content type bonus
@@ -305,77 +757,41 @@ class LinkValidationService:
 
         return min(100.0, max(0.0, score))
 
-    def _get_domain_trust_score(self, url: str) -> float:
-        """Get trust score for domain."""
+    def _get_domain_trust_score(self, domain: str) -> float:
+        """Get trust score for a host name."""
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Check for exact matches
-            if domain in self.trusted_domains:
-                return 100.0
-
-            # Check for subdomain matches
-            for trusted_domain in self.trusted_domains:
-                if domain.endswith(f".{trusted_domain}"):
-                    return 95.0
-
-            # Government domains
-            if domain.endswith('.gov.in') or domain.endswith('.gov'):
-                return 90.0
-
-            # Educational domains
-            if domain.endswith('.edu') or domain.endswith('.ac.in'):
-                return 85.0
-
-            # Organization domains
-            if domain.endswith('.org'):
-                return 75.0
-
-            # Commercial domains
-            if domain.endswith('.com') or domain.endswith('.in'):
-                return 60.0
-
-            return 40.0
-
+            return _domain_trust_score(domain.lower())
         except Exception:
             return 30.0
 
-    def _get_content_quality_score(self, content: str) -> float:
+    def _analyze_content(self, content: bytes) -> ContentAnalysis:
+        """Score and check content with a single keyword scan."""
+        found = self._find_keywords(content) if content else set()
+        return ContentAnalysis(
+            quality_score=self._get_content_quality_score(content, found),
+            issues=self._check_content_quality(content, found),
+            suspicious=self._is_suspicious_content(content, found)
+        )
+
+    def _get_content_quality_score(self, content: bytes, found: Optional[set] = None) -> float:
         """Get content quality score."""
         if not content:
             return 0.0
 
         score = 50.0
+        if found is None:
+            found = self._find_keywords(content)
 
         # Check for scholarship-related keywords
-        scholarship_keywords = [
-            'scholarship', 'fellowship', 'grant', 'financial aid', 'education',
-            'student', 'application', 'eligibility', 'criteria', 'deadline'
-        ]
-
-        keyword_count = sum(1 for keyword in scholarship_keywords
-                            if keyword.lower() in content.lower())
+        keyword_count = len(found & _SCHOLARSHIP_KEYWORDS)
         score += min(30.0, keyword_count * 3.0)
 
         # Check for application process information
-        process_keywords = [
-            'apply', 'application form', 'submit', 'documents', 'requirements',
-            'how to apply', 'selection process', 'merit', 'interview'
-        ]
-
-        process_count = sum(1 for keyword in process_keywords
-                            if keyword.lower() in content.lower())
+        process_count = len(found & _PROCESS_KEYWORDS)
         score += min(20.0, process_count * 2.0)
 
         # Penalty for spam indicators
-        spam_keywords = [
-            'click here', 'act now', 'limited time', 'guaranteed', 'instant',
-            'free money', 'no fee', 'easy money', 'work from home'
-        ]
-
-        spam_count = sum(1 for keyword in spam_keywords
-                         if keyword.lower() in content.lower())
+        spam_count = len(found & _SPAM_KEYWORDS)
         score -= min(40.0, spam_count * 10.0)
 
         # Content length bonus
@@ -386,7 +802,7 @@ class LinkValidationService:
 
         return min(100.0, max(0.0, score))
 
-    def _check_content_quality(self, content: str) -> List[str]:
+    def _check_content_quality(self, content: bytes, found: Optional[set] = None) -> List[str]:
         """Check content for quality issues."""
         issues = []
 
@@ -398,38 +814,32 @@ class LinkValidationService:
         if len(content) < 100:
             issues.append("Very short content")
 
+        if found is None:
+            found = self._find_keywords(content)
+
         # Check for suspicious patterns
-        suspicious_content = [
-            'click here to download',
-            'guaranteed scholarship',
-            'no application fee',
-            'instant approval',
-            'limited time offer'
-        ]
-
-        for pattern in suspicious_content:
-            if pattern.lower() in content.lower():
-                issues.append(f"Suspicious content: {pattern}")
+        for pattern, issue in _SUSPICIOUS_CONTENT_ISSUES:
+            if pattern in found:
+                issues.append(issue)
 
         # Check for missing important information
-        if 'eligibility' not in content.lower():
+        if 'eligibility' not in found:
             issues.append("Missing eligibility criteria")
 
-        if 'deadline' not in content.lower() and 'last date' not in content.lower():
+        if 'deadline' not in found and 'last date' not in found:
             issues.append("Missing deadline information")
 
         return issues
 
-    def _is_suspicious_content(self, content: str) -> bool:
+    def _is_suspicious_content(self, content: bytes, found: Optional[set] = None) -> bool:
         """Check if content appears suspicious."""
         if not content:
             return True
 
         # Check for excessive promotional language
-        promotional_words = ['guaranteed', 'instant',
-                             'free money', 'no fee', 'easy money']
-        promotional_count = sum(1 for word in promotional_words
-                                if word.lower() in content.lower())
+        if found is None:
+            found = self._find_keywords(content)
+        promotional_count = len(found & _PROMOTIONAL_KEYWORDS)
 
         if promotional_count > 3:
             return True
@@ -445,31 +855,40 @@ class LinkValidationService:
         if not results:
             return {}
 
+        # Single pass over the results for all three aggregates
         total_count = len(results)
-        status_counts = {}
-
+        status_counts = Counter()
+        total_response_time = 0.0
+        total_quality_score = 0.0
         for result in results:
-            status = result.status
-            if status not in status_counts:
-                status_counts[status] = 0
-            status_counts[status] += 1
+            status_counts[result.status] += 1
+            total_response_time += result.response_time
+            total_quality_score += result.quality_score
 
-        avg_response_time = sum(
-            result.response_time for result in results) / total_count
-        avg_quality_score = sum(
-            result.quality_score for result in results) / total_count
+        avg_response_time = total_response_time / total_count
+        avg_quality_score = total_quality_score / total_count
 
         return {
             "total_urls": total_count,
-            "status_distribution": status_counts,
+            "status_distribution": dict(status_counts),
             "average_response_time": avg_response_time,
             "average_quality_score": avg_quality_score,
             "validation_timestamp": datetime.utcnow().isoformat()
         }
 
 # Helper function to get validation service instance
+_validation_service: Optional[LinkValidationService] = None
 
 
 def get_validation_service() -> LinkValidationService:
-    """Get validation service instance."""
-    return LinkValidationService()
+    """Get the shared validation service instance."""
+    global _validation_service
+    if _validation_service is None:
+        _validation_service = LinkValidationService()
+    return _validation_service
+
+
+async def close_validation_service():
+    """Close the shared validation service's HTTP client, if it was created."""
+    if _validation_service is not None:
+        await _validation_service.close()
@@ -3,47 +3,61 @@ Enhanced Celery Task for Dynamic Scholarship Discovery and Scraping
 Integrates dynamic crawler with existing scraping infrastructure
 """
 
-from celery import current_task
+from celery import current_task, group, chord
 from celery_app import app
-import asyncio
+import hashlib
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, load_only
 
 from ..models.models import ScrapingJob, Scholarship, ScrapingSource
 from ..services.dynamic_crawler import DynamicScholarshipCrawler
-from ..services.scraping_service import ScrapingService
-from ..core.database import get_db_session
+from ..services.scraping_service import get_scraping_service
+from ..core.database import get_db_session, try_advisory_xact_lock
+from ..core.worker_runtime import run_async, get_shared_browser
 from ..core.config import settings
+from ..core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock keys serializing the periodic discovery tasks
+_DISCOVERY_SCHEDULER_LOCK = 0xD15C0DE
+_SOURCE_VALIDATION_LOCK = 0xD15C0DF
+
 
 @app.task(bind=True, name="app.tasks.scraping_tasks.discover_new_scholarship_sources")
-def discover_new_scholarship_sources(self, max_depth: int = 2, max_pages_per_source: int = 30):
+def discover_new_scholarship_sources(self, max_depth: int = 2, max_pages_per_source: int = 30,
+                                     max_concurrent: int = None, requests_per_period: int = None):
     """
     Dynamically discover new scholarship sources using AI-powered crawling
+
+    max_concurrent and requests_per_period override the crawler's page
+    concurrency and per-domain rate limit settings for this run.
     """
     try:
         # Create discovery job record
         with get_db_session() as db:
-            job = ScrapingJob(
+            # merge() so a retry, which reuses the task id, updates the
+            # existing job row instead of failing on the primary key
+            job = db.merge(ScrapingJob(
                 id=self.request.id,
                 source="DYNAMIC_DISCOVERY",
                 status="running",
                 started_at=datetime.utcnow(),
+                completed_at=None,
                 metadata={
                     "max_depth": max_depth,
                     "max_pages_per_source": max_pages_per_source,
                     "job_type": "discovery"
                 }
-            )
-            db.add(job)
+            ))
             db.commit()
 
-            # Initialize dynamic crawler
-            crawler = DynamicScholarshipCrawler()
+            # Initialize dynamic crawler on the worker's shared browser
+            crawler = DynamicScholarshipCrawler(
+                browser=run_async(get_shared_browser()))
 
             # Seed URLs for discovery
             seed_urls = [
@@ -65,53 +79,68 @@ def discover_new_scholarship_sources(self, max_depth: int = 2, max_pages_per_sou
                 f"Starting dynamic discovery with {len(seed_urls)} seed URLs")
 
             # Start discovery process
-            discovered_pages = asyncio.run(
+            discovered_pages = run_async(
                 crawler.discover_scholarship_sources(
                     seed_urls=seed_urls,
                     max_depth=max_depth,
-                    max_pages_per_source=max_pages_per_source
+                    max_pages_per_source=max_pages_per_source,
+                    max_concurrent=max_concurrent,
+                    requests_per_period=requests_per_period
                 )
             )
 
             # Save discovered sources to database
-            new_sources_count = 0
             high_priority_sources = []
+            batch_size = settings.SCRAPING_SAVE_BATCH_SIZE
 
+            # Check which sources already exist with one query per batch
+            pages_by_url = {}
             for page in discovered_pages:
-                # Check if source already exists
-                existing_source = db.query(ScrapingSource).filter(
-                    ScrapingSource.url == page.url
-                ).first()
-
-                if not existing_source:
-                    # Create new source record
-                    new_source = ScrapingSource(
-                        url=page.url,
-                        name=page.title,
-                        domain=page.source_domain,
-                        source_type=page.page_type,
-                        relevance_score=page.relevance_score,
-                        estimated_scholarships=page.estimated_scholarships,
-                        status="discovered",
-                        metadata=page.metadata,
-                        discovered_at=datetime.utcnow(),
-                        last_scraped=None
+                pages_by_url.setdefault(page.url, page)
+            urls = list(pages_by_url)
+            existing_urls = set()
+            for i in range(0, len(urls), batch_size):
+                existing_urls.update(
+                    url for (url,) in db.query(ScrapingSource.url).filter(
+                        ScrapingSource.url.in_(urls[i:i + batch_size])
                     )
-                    db.add(new_source)
-                    new_sources_count += 1
+                )
 
-                    # Track high-priority sources for immediate scraping
-                    if page.relevance_score >= 0.7:
-                        high_priority_sources.append(page)
+            discovered_at = datetime.utcnow()
+            new_sources = []
+            for url, page in pages_by_url.items():
+                if url in existing_urls:
+                    continue
 
-            db.commit()
+                # Create new source record
+                new_sources.append({
+                    "url": page.url,
+                    "name": page.title,
+                    "domain": page.source_domain,
+                    "source_type": page.page_type,
+                    "relevance_score": page.relevance_score,
+                    "estimated_scholarships": page.estimated_scholarships,
+                    "status": "discovered",
+                    "metadata": page.metadata,
+                    "discovered_at": discovered_at,
+                    "last_scraped": None
+                })
+
+                # Track high-priority sources for immediate scraping
+                if page.relevance_score >= 0.7:
+                    high_priority_sources.append(page)
+
+            for i in range(0, len(new_sources), batch_size):
+                db.execute(ScrapingSource.__table__.insert(),
+                           new_sources[i:i + batch_size])
+            new_sources_count = len(new_sources)
 
             # Save discovery results to file
             crawler.save_discovered_sources(
                 f'discovery_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
             )
 
-            # Update job status
+            # Update job status; committed together with the new sources
             job.status = "completed"
             job.completed_at = datetime.utcnow()
             job.total_urls = len(discovered_pages)
@@ -130,13 +159,20 @@ def discover_new_scholarship_sources(self, max_depth: int = 2, max_pages_per_sou
             if high_priority_sources:
                 logger.info(
                     f"Triggering immediate scraping of {len(high_priority_sources)} high-priority sources")
-                # Limit to top 5 to avoid overload
-                for source in high_priority_sources[:5]:
-                    scrape_discovered_source.delay(
+                # Limit to top 5 to avoid overload. The scrapes run in
+                # parallel and a single callback records their outcome.
+                header = [
+                    scrape_discovered_source.s(
                         source_url=source.url,
                         source_name=source.title,
                         priority="high"
                     )
+                    for source in high_priority_sources[:5]
+                    if _claim_scrape(source.url)
+                ]
+                if header:
+                    chord(group(header))(
+                        update_discovery_summary.s(job_id=job.id))
 
             return {
                 "status": "success",
@@ -174,23 +210,26 @@ def scrape_discovered_source(self, source_url: str, source_name: str, priority:
     try:
         # Create scraping job record
         with get_db_session() as db:
-            job = ScrapingJob(
+            # merge() so a retry, which reuses the task id, updates the
+            # existing job row instead of failing on the primary key
+            job = db.merge(ScrapingJob(
                 id=self.request.id,
                 source=f"DISCOVERED_{source_name}",
                 status="running",
                 started_at=datetime.utcnow(),
+                completed_at=None,
                 metadata={
                     "source_url": source_url,
                     "source_name": source_name,
                     "priority": priority,
                     "job_type": "discovered_source_scraping"
                 }
-            )
-            db.add(job)
+            ))
             db.commit()
 
-            # Initialize scraping service
-            scraping_service = ScrapingService()
+            # Initialize scraping service on the worker's shared browser
+            scraping_service = get_scraping_service(
+                browser=run_async(get_shared_browser()))
 
             logger.info(
                 f"Starting scraping of discovered source: {source_name}")
@@ -200,7 +239,7 @@ def scrape_discovered_source(self, source_url: str, source_name: str, priority:
             domain = urlparse(source_url).netloc
 
             # Scrape the source
-            scraped_scholarships = asyncio.run(
+            scraped_scholarships = run_async(
                 scraping_service.scrape_scholarships(
                     source_url=source_url,
                     source_name=domain,
@@ -211,52 +250,70 @@ def scrape_discovered_source(self, source_url: str, source_name: str, priority:
             # Process and save scholarships
             new_scholarships = 0
             updated_scholarships = 0
-
+            batch_size = settings.SCRAPING_SAVE_BATCH_SIZE
+
+            # Load existing scholarships matching any scraped title in one
+            # query per batch, keyed by (title, provider)
+            titles = list({s.title for s in scraped_scholarships})
+            existing = {}
+            for i in range(0, len(titles), batch_size):
+                for scholarship in db.query(Scholarship).filter(
+                    Scholarship.title.in_(titles[i:i + batch_size])
+                ):
+                    existing[(scholarship.title, scholarship.provider)] = scholarship
+
+            now = datetime.utcnow()
+            new_rows = []
             for scraped_scholarship in scraped_scholarships:
                 try:
-                    # Check if scholarship already exists
-                    existing_scholarship = db.query(Scholarship).filter(
-                        Scholarship.title == scraped_scholarship.title,
-                        Scholarship.provider == scraped_scholarship.provider
-                    ).first()
+                    key = (scraped_scholarship.title,
+                           scraped_scholarship.provider)
+                    existing_scholarship = existing.get(key)
 
-                    if existing_scholarship:
+                    if existing_scholarship is not None:
                         # Update existing scholarship
                         existing_scholarship.description = scraped_scholarship.description
                         existing_scholarship.amount = scraped_scholarship.amount
                         existing_scholarship.deadline = scraped_scholarship.deadline
-                        existing_scholarship.updated_at = datetime.utcnow()
+                        existing_scholarship.updated_at = now
                         updated_scholarships += 1
-                    else:
+                    elif key not in existing:
                         # Create new scholarship
-                        new_scholarship = Scholarship(
-                            title=scraped_scholarship.title,
-                            description=scraped_scholarship.description,
-                            amount=scraped_scholarship.amount,
-                            deadline=scraped_scholarship.deadline,
-                            eligibility=", ".join(
+                        new_rows.append({
+                            "title": scraped_scholarship.title,
+                            # Same exact-duplicate key save_scraped_scholarships stores
+                            "title_hash": scraping_service.duplication_detector.title_hash(
+                                scraped_scholarship.title, scraped_scholarship.source),
+                            "description": scraped_scholarship.description,
+                            "amount": scraped_scholarship.amount,
+                            "deadline": scraped_scholarship.deadline,
+                            "eligibility": ", ".join(
                                 scraped_scholarship.eligibility),
-                            application_url=scraped_scholarship.application_url,
-                            source=scraped_scholarship.source,
-                            category=scraped_scholarship.category,
-                            level=scraped_scholarship.level,
-                            state=scraped_scholarship.state,
-                            provider=scraped_scholarship.provider,
-                            verified=False,  # Newly discovered sources start as unverified
-                            trending=False,
-                            views=0,
-                            applications=0,
-                            tags=scraped_scholarship.tags,
-                            created_at=datetime.utcnow(),
-                            updated_at=datetime.utcnow()
-                        )
-                        db.add(new_scholarship)
+                            "application_url": scraped_scholarship.application_url,
+                            "source": scraped_scholarship.source,
+                            "category": scraped_scholarship.category,
+                            "level": scraped_scholarship.level,
+                            "state": scraped_scholarship.state,
+                            "provider": scraped_scholarship.provider,
+                            "is_verified": False,  # Newly discovered sources start as unverified
+                            "view_count": 0,
+                            "application_count": 0,
+                            "tags": scraped_scholarship.tags,
+                            "created_at": now,
+                            "updated_at": now
+                        })
+                        # Later duplicates within this batch are skipped
+                        existing[key] = None
                         new_scholarships += 1
 
                 except Exception as e:
                     logger.error(f"Error processing scholarship: {str(e)}")
                     continue
 
+            for i in range(0, len(new_rows), batch_size):
+                db.execute(Scholarship.__table__.insert(),
+                           new_rows[i:i + batch_size])
+
             db.commit()
 
             # Update source record
@@ -317,6 +374,57 @@ def scrape_discovered_source(self, source_url: str, source_name: str, priority:
         raise self.retry(exc=e, countdown=300, max_retries=2)
 
 
+@app.task(bind=True, name="app.tasks.scraping_tasks.update_discovery_summary")
+def update_discovery_summary(self, results: List[Dict[str, Any]], job_id: str):
+    """
+    Record the outcome of the high-priority scrapes triggered by a discovery job
+    """
+    results = [r for r in results if isinstance(r, dict)]
+    summary = {
+        "scraped_sources": len(results),
+        "new_scholarships": sum(r.get("new_scholarships", 0) for r in results),
+        "updated_scholarships": sum(r.get("updated_scholarships", 0) for r in results),
+        "total_scraped": sum(r.get("total_scraped", 0) for r in results)
+    }
+
+    with get_db_session() as db:
+        job = db.query(ScrapingJob).filter(ScrapingJob.id == job_id).first()
+        if job:
+            # Reassign so the JSON column change is tracked
+            job.metadata = {**(job.metadata or {}),
+                            "high_priority_scraping": summary}
+            db.commit()
+
+    logger.info(f"High-priority scraping for discovery {job_id} finished: {summary}")
+    return summary
+
+
+def _claim_scrape(url: str) -> bool:
+    """
+    Claim a source URL for scraping within the de-dup window
+
+    Returns False if the URL was already enqueued recently, by discovery or
+    by validation.
+    """
+    key = f"scrape:lock:{hashlib.sha1(url.encode()).hexdigest()}"
+    return cache.claim(key, settings.SCRAPE_DEDUP_WINDOW_SECONDS)
+
+
+def enqueue_scrape_once(url: str, name: str, priority: str) -> bool:
+    """
+    Enqueue scrape_discovered_source unless the URL is already claimed
+    """
+    if not _claim_scrape(url):
+        logger.info(f"Skipping duplicate scrape of {url}")
+        return False
+    scrape_discovered_source.delay(
+        source_url=url,
+        source_name=name,
+        priority=priority
+    )
+    return True
+
+
 @app.task(bind=True, name="app.tasks.scraping_tasks.intelligent_discovery_scheduler")
 def intelligent_discovery_scheduler(self):
     """
@@ -324,6 +432,14 @@ def intelligent_discovery_scheduler(self):
     """
     try:
         with get_db_session() as db:
+            # Only one scheduler decides at a time
+            if not try_advisory_xact_lock(db, _DISCOVERY_SCHEDULER_LOCK):
+                logger.info("Discovery scheduler already running")
+                return {
+                    "status": "discovery_skipped",
+                    "reason": "already running"
+                }
+
             # Check when last discovery was run
             last_discovery = db.query(ScrapingJob).filter(
                 ScrapingJob.source == "DYNAMIC_DISCOVERY",
@@ -342,14 +458,15 @@ def intelligent_discovery_scheduler(self):
                 discovery_reason = "Weekly discovery schedule"
             else:
                 # Check if current sources are performing poorly
-                recent_jobs = db.query(ScrapingJob).filter(
-                    ScrapingJob.completed_at >= datetime.utcnow() - timedelta(days=3),
-                    ScrapingJob.status == "completed"
-                ).all()
-
-                if recent_jobs:
-                    avg_new_scholarships = sum(
-                        job.new_scholarships or 0 for job in recent_jobs) / len(recent_jobs)
+                # Average computed by the database; NULL when there are no jobs
+                avg_new_scholarships = db.query(
+                    func.avg(func.coalesce(ScrapingJob.new_scholarships, 0))
+                ).filter(
+                    ScrapingJob.status == "completed",
+                    ScrapingJob.completed_at >= datetime.utcnow() - timedelta(days=3)
+                ).scalar()
+
+                if avg_new_scholarships is not None:
                     if avg_new_scholarships < 5:  # Low productivity threshold
                         should_run_discovery = True
                         discovery_reason = "Low productivity from existing sources"
@@ -382,8 +499,20 @@ def validate_discovered_sources(self):
     """
     try:
         with get_db_session() as db:
+            if not try_advisory_xact_lock(db, _SOURCE_VALIDATION_LOCK):
+                logger.info("Source validation already running")
+                return {
+                    "status": "skipped",
+                    "reason": "already running"
+                }
+
             # Get sources that haven't been validated recently
-            sources_to_validate = db.query(ScrapingSource).filter(
+            # Only the columns needed to enqueue; metadata is loaded lazily
+            # for the rare source that fails
+            sources_to_validate = db.query(ScrapingSource).options(
+                load_only(ScrapingSource.id, ScrapingSource.url,
+                          ScrapingSource.name, ScrapingSource.status)
+            ).filter(
                 ScrapingSource.status == "discovered",
                 ScrapingSource.last_scraped.is_(None)
             ).limit(10).all()  # Validate 10 sources per run
@@ -392,12 +521,8 @@ def validate_discovered_sources(self):
             for source in sources_to_validate:
                 try:
                     # Trigger scraping for validation
-                    scrape_discovered_source.delay(
-                        source_url=source.url,
-                        source_name=source.name,
-                        priority="validation"
-                    )
-                    validated_count += 1
+                    if enqueue_scrape_once(source.url, source.name, "validation"):
+                        validated_count += 1
 
                 except Exception as e:
                     logger.error(
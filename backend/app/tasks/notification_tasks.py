@@ -5,18 +5,15 @@ Background tasks for sending notifications to users.
 from ..models.models import User, Notification, Scholarship
 from ..services.notification_service import NotificationService
 from ..core.database import get_db_session
+from ..core.config import settings
 from celery_app import app
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from celery import current_task
 from sqlalchemy.orm import Session
 
-# Import celery app from parent directory
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 logger = logging.getLogger(__name__)
 
 
@@ -73,45 +70,53 @@ def send_bulk_notifications(self, notification_data: List[Dict[str, Any]]) -> Di
     """
     try:
         with get_db_session() as db:
-            notification_service = NotificationService(db)
-
-            results = []
-            for data in notification_data:
-                user_id = data.get('user_id')
-                notification_type = data.get('notification_type')
-                content = data.get('content', {})
-
-                user = db.query(User).filter(User.id == user_id).first()
-                if not user:
-                    logger.warning(f"User {user_id} not found")
-                    continue
-
-                result = notification_service.send_email_notification(
-                    user=user,
-                    notification_type=notification_type,
-                    data=content
-                )
+            # Load all recipient addresses in one query instead of one per
+            # entry. Only plain values reach the send threads; the session
+            # and ORM instances stay on this thread.
+            user_ids = {data.get('user_id') for data in notification_data}
+            emails = dict(
+                db.query(User.id, User.email).filter(User.id.in_(user_ids)).all()
+            )
 
-                results.append({
-                    'user_id': user_id,
-                    'notification_type': notification_type,
-                    'sent': result,
-                    'timestamp': datetime.utcnow().isoformat()
-                })
+        sendable = []
+        for data in notification_data:
+            user_id = data.get('user_id')
+            if user_id not in emails:
+                logger.warning(f"User {user_id} not found")
+                continue
+            sendable.append((emails[user_id], data.get('notification_type'), data.get('content', {})))
+
+        def send(entry):
+            return NotificationService.send_email(*entry)
+
+        # Overlap the network-bound sends on a bounded pool. Only counts
+        # are returned; a per-recipient list would be stored in the
+        # result backend with no reader.
+        processed = 0
+        sent = 0
+        total = len(notification_data)
+        # Report progress about 100 times rather than once per send
+        progress_step = max(1, len(sendable) // 100)
+        with ThreadPoolExecutor(max_workers=settings.EMAIL_SEND_CONCURRENCY) as executor:
+            for result in executor.map(send, sendable):
+                processed += 1
+                if result:
+                    sent += 1
 
                 # Update task progress
-                current_task.update_state(
-                    state='PROGRESS',
-                    meta={'processed': len(
-                        results), 'total': len(notification_data)}
-                )
-
-            return {
-                'status': 'completed',
-                'processed': len(results),
-                'total': len(notification_data),
-                'results': results
-            }
+                if processed % progress_step == 0 or processed == len(sendable):
+                    current_task.update_state(
+                        state='PROGRESS',
+                        meta={'processed': processed, 'total': total}
+                    )
+
+        return {
+            'status': 'completed',
+            'processed': processed,
+            'sent': sent,
+            'failed': processed - sent,
+            'total': total
+        }
 
     except Exception as e:
         logger.error(f"Error sending bulk notifications: {str(e)}")
@@ -131,10 +136,11 @@ def send_deadline_reminders(self) -> Dict[str, Any]:
             notification_service = NotificationService(db)
 
             # Get scholarships with deadlines in the next 7 days
-            deadline_threshold = datetime.utcnow() + timedelta(days=7)
+            now = datetime.utcnow()
+            deadline_threshold = now + timedelta(days=7)
             upcoming_scholarships = db.query(Scholarship).filter(
                 Scholarship.deadline <= deadline_threshold,
-                Scholarship.deadline > datetime.utcnow(),
+                Scholarship.deadline > now,
                 Scholarship.is_active == True
             ).all()
 
@@ -144,29 +150,42 @@ def send_deadline_reminders(self) -> Dict[str, Any]:
                     'message': 'No upcoming deadlines'
                 }
 
-            # Get users interested in these scholarships
+            # Template data is the same for every user of a scholarship, so
+            # it is built once per scholarship and shared
+            upcoming = [
+                (scholarship, {
+                    'scholarship': scholarship.to_dict(),
+                    'days_remaining': (scholarship.deadline - now).days
+                })
+                for scholarship in upcoming_scholarships
+            ]
+
+            # Walk active users once, loading only the columns the send and
+            # the preference check need, a batch at a time. The settings are
+            # JSON, so they are matched in Python by should_notify_user.
+            batch_size = settings.EMAIL_BULK_BATCH_SIZE
+            users = db.query(
+                User.id, User.email, User.notification_settings, User.preferences
+            ).filter(User.is_active == True).yield_per(batch_size)
+
+            # Collect per-recipient template data and send it in batches,
+            # one SMTP connection per batch
             notifications_sent = 0
-            for scholarship in upcoming_scholarships:
-                # Find users who have shown interest or applied
-                interested_users = db.query(User).filter(
-                    User.is_active == True,
-                    User.email_notifications_enabled == True
-                ).all()
-
-                for user in interested_users:
-                    # Check if user matches scholarship criteria
-                    if notification_service.should_notify_user(user, scholarship):
-                        result = notification_service.send_email_notification(
-                            user=user,
-                            notification_type='deadline_reminder',
-                            data={
-                                'scholarship': scholarship.to_dict(),
-                                'days_remaining': (scholarship.deadline - datetime.utcnow()).days
-                            }
-                        )
-
-                        if result:
-                            notifications_sent += 1
+            recipients = []
+            for user in users:
+                for scholarship, payload in upcoming:
+                    if not notification_service.should_notify_user(user, scholarship):
+                        continue
+                    recipients.append((user, payload))
+
+                    if len(recipients) >= batch_size:
+                        notifications_sent += notification_service.send_bulk_email_notifications(
+                            'deadline_reminder', recipients)
+                        recipients = []
+
+            if recipients:
+                notifications_sent += notification_service.send_bulk_email_notifications(
+                    'deadline_reminder', recipients)
 
             return {
                 'status': 'completed',
@@ -231,7 +250,7 @@ def send_new_scholarship_alerts(self, scholarship_id: int) -> Dict[str, Any]:
         raise self.retry(exc=e, countdown=60)
 
 
-@app.task(bind=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
+@app.task(bind=True, ignore_result=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
 def cleanup_old_notifications(self) -> Dict[str, Any]:
     """
     Clean up old notifications.
@@ -244,14 +263,10 @@ def cleanup_old_notifications(self) -> Dict[str, Any]:
             # Delete notifications older than 30 days
             cutoff_date = datetime.utcnow() - timedelta(days=30)
 
-            old_notifications = db.query(Notification).filter(
+            # One DELETE statement; rows are never loaded into the session
+            deleted_count = db.query(Notification).filter(
                 Notification.created_at <= cutoff_date
-            ).all()
-
-            deleted_count = 0
-            for notification in old_notifications:
-                db.delete(notification)
-                deleted_count += 1
+            ).delete(synchronize_session=False)
 
             db.commit()
 
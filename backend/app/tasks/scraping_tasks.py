@@ -3,351 +3,256 @@ Background tasks for scraping scholarship data.
 """
 
 from ..models.models import ScrapingJob, Scholarship
-from ..services.validation_service import LinkValidationService
-from ..services.scraping_service import ScrapingService
-from ..core.database import get_db_session
+from ..services.validation_service import get_validation_service
+from ..services.scraping_service import get_scraping_service
+from ..core.database import get_db_session, set_async_commit, bulk_update_by_id, dialect_insert
+from ..core.config import settings
+from ..core.worker_runtime import run_async, get_shared_browser
 from celery_app import app
-import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 from celery import current_task
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
-# Import celery app from parent directory
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-
 logger = logging.getLogger(__name__)
 
 
-@app.task(bind=True, name="app.tasks.scraping_tasks.scrape_nsp_scholarships")
-def scrape_nsp_scholarships(self, force_update: bool = False):
-    """Scrape scholarships from NSP (National Scholarship Portal)."""
-    try:
-        # Create scraping job record
-        with get_db_session() as db:
-            job = ScrapingJob(
-                id=self.request.id,
-                source="NSP",
-                status="running",
-                started_at=datetime.utcnow(),
-                metadata={"force_update": force_update}
-            )
-            db.add(job)
-            db.commit()
-
-            # Initialize services
-            scraping_service = ScrapingService(db)
-
-            # Start scraping
-            logger.info("Starting NSP scholarship scraping...")
-            result = asyncio.run(scraping_service.scrape_nsp_scholarships())
+# Named sources and the ScrapingService coroutine that scrapes each
+_SOURCE_SCRAPERS = {
+    "NSP": ("NSP", lambda service: service.scrape_nsp_scholarships()),
+    "UGC": ("UGC", lambda service: service.scrape_ugc_scholarships()),
+    "GOVERNMENT": ("Government", lambda service: service.scrape_government_scholarships()),
+}
 
-            # Update job status
-            job.status = "completed"
-            job.completed_at = datetime.utcnow()
-            job.total_urls = result.get("total_urls", 0)
-            job.processed_urls = result.get("processed_urls", 0)
-            job.successful_urls = result.get("successful_urls", 0)
-            job.failed_urls = result.get("failed_urls", 0)
-            job.new_scholarships = result.get("new_scholarships", 0)
-            job.updated_scholarships = result.get("updated_scholarships", 0)
-            job.metadata = result.get("metadata", {})
 
-            db.commit()
+def _run_scrape(task, source: str, metadata: Dict[str, Any], url: str = None):
+    """
+    Run one scrape under a ScrapingJob record
 
-            logger.info(
-                f"NSP scraping completed. New: {job.new_scholarships}, Updated: {job.updated_scholarships}")
+    Creates the running job, scrapes `url` (under the name `source`) or, without
+    a URL, the named source in _SOURCE_SCRAPERS, records the outcome on the
+    job and returns the task result. On error the job is marked failed and
+    the task retried.
+    """
+    if url is None:
+        label, scrape = _SOURCE_SCRAPERS[source]
+    else:
+        label, scrape = source, lambda service: service.scrape_single_source(url)
 
-            return {
-                "status": "success",
-                "job_id": job.id,
-                "new_scholarships": job.new_scholarships,
-                "updated_scholarships": job.updated_scholarships,
-                "total_processed": job.processed_urls
-            }
-
-    except Exception as e:
-        logger.error(f"Error in NSP scraping task: {str(e)}")
-
-        # Update job status to failed
-        try:
-            with get_db_session() as db:
-                job = db.query(ScrapingJob).filter(
-                    ScrapingJob.id == self.request.id).first()
-                if job:
-                    job.status = "failed"
-                    job.completed_at = datetime.utcnow()
-                    job.errors = [str(e)]
-                    db.commit()
-        except:
-            pass
-
-        raise self.retry(exc=e, countdown=300, max_retries=3)
+    job_id = task.request.id
 
-
-@app.task(bind=True, name="app.tasks.scraping_tasks.scrape_ugc_scholarships")
-def scrape_ugc_scholarships(self, force_update: bool = False):
-    """Scrape scholarships from UGC sources."""
     try:
+        # Plain INSERT/UPDATE statements; the job is never loaded into the
+        # session, so nothing is flushed or refreshed implicitly. Each
+        # statement gets its own short session so no pooled connection is
+        # held while the scrape runs.
         with get_db_session() as db:
-            job = ScrapingJob(
-                id=self.request.id,
-                source="UGC",
+            # A retry or redelivery reuses the task id, so an existing row
+            # is reset to running instead of failing on the primary key
+            stmt = dialect_insert(ScrapingJob).values(
+                id=job_id,
+                source=source,
                 status="running",
                 started_at=datetime.utcnow(),
-                metadata={"force_update": force_update}
+                metadata=metadata
             )
-            db.add(job)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[ScrapingJob.id],
+                set_={
+                    "status": stmt.excluded.status,
+                    "started_at": stmt.excluded.started_at,
+                    "completed_at": None
+                }
+            ))
             db.commit()
 
-            scraping_service = ScrapingService(db)
-
-            logger.info("Starting UGC scholarship scraping...")
-            result = asyncio.run(scraping_service.scrape_ugc_scholarships())
-
-            # Update job status
-            job.status = "completed"
-            job.completed_at = datetime.utcnow()
-            job.total_urls = result.get("total_urls", 0)
-            job.processed_urls = result.get("processed_urls", 0)
-            job.successful_urls = result.get("successful_urls", 0)
-            job.failed_urls = result.get("failed_urls", 0)
-            job.new_scholarships = result.get("new_scholarships", 0)
-            job.updated_scholarships = result.get("updated_scholarships", 0)
-            job.metadata = result.get("metadata", {})
-
+        scraping_service = get_scraping_service(
+            browser=run_async(get_shared_browser()))
+
+        logger.info(f"Starting {label} scholarship scraping...")
+        result = run_async(scrape(scraping_service))
+
+        # Update job status
+        counters = {
+            "total_urls": result.get("total_urls", 0),
+            "processed_urls": result.get("processed_urls", 0),
+            "successful_urls": result.get("successful_urls", 0),
+            "failed_urls": result.get("failed_urls", 0),
+            "new_scholarships": result.get("new_scholarships", 0),
+            "updated_scholarships": result.get("updated_scholarships", 0)
+        }
+        with get_db_session() as db:
+            db.execute(update(ScrapingJob).where(ScrapingJob.id == job_id).values(
+                status="completed",
+                completed_at=datetime.utcnow(),
+                metadata=result.get("metadata", {}),
+                **counters
+            ))
             db.commit()
 
-            logger.info(
-                f"UGC scraping completed. New: {job.new_scholarships}, Updated: {job.updated_scholarships}")
+        logger.info(
+            f"{label} scraping completed. New: {counters['new_scholarships']}, Updated: {counters['updated_scholarships']}")
 
-            return {
-                "status": "success",
-                "job_id": job.id,
-                "new_scholarships": job.new_scholarships,
-                "updated_scholarships": job.updated_scholarships,
-                "total_processed": job.processed_urls
-            }
+        return {
+            "status": "success",
+            "job_id": job_id,
+            "source": source,
+            "new_scholarships": counters["new_scholarships"],
+            "updated_scholarships": counters["updated_scholarships"],
+            "total_processed": counters["processed_urls"]
+        }
 
     except Exception as e:
-        logger.error(f"Error in UGC scraping task: {str(e)}")
+        logger.error(f"Error in {label} scraping task: {str(e)}")
 
+        # Update job status to failed
         try:
             with get_db_session() as db:
-                job = db.query(ScrapingJob).filter(
-                    ScrapingJob.id == self.request.id).first()
-                if job:
-                    job.status = "failed"
-                    job.completed_at = datetime.utcnow()
-                    job.errors = [str(e)]
-                    db.commit()
+                db.execute(update(ScrapingJob).where(ScrapingJob.id == job_id).values(
+                    status="failed",
+                    completed_at=datetime.utcnow(),
+                    errors=[str(e)]
+                ))
+                db.commit()
         except:
             pass
 
-        raise self.retry(exc=e, countdown=300, max_retries=3)
-
+        raise task.retry(exc=e, countdown=300, max_retries=3)
 
-@app.task(bind=True, name="app.tasks.scraping_tasks.scrape_government_scholarships")
-def scrape_government_scholarships(self, force_update: bool = False):
-    """Scrape scholarships from various government sources."""
-    try:
-        with get_db_session() as db:
-            job = ScrapingJob(
-                id=self.request.id,
-                source="GOVERNMENT",
-                status="running",
-                started_at=datetime.utcnow(),
-                metadata={"force_update": force_update}
-            )
-            db.add(job)
-            db.commit()
 
-            scraping_service = ScrapingService(db)
+@app.task(bind=True, name="app.tasks.scraping_tasks.scrape_source")
+def scrape_source(self, source: str, force_update: bool = False, url: str = None):
+    """Scrape a named source (NSP, UGC, GOVERNMENT) or a single URL."""
+    metadata = {"source_url": url} if url else {"force_update": force_update}
+    return _run_scrape(self, source, metadata, url)
 
-            logger.info("Starting government scholarship scraping...")
-            result = asyncio.run(
-                scraping_service.scrape_government_scholarships())
-
-            # Update job status
-            job.status = "completed"
-            job.completed_at = datetime.utcnow()
-            job.total_urls = result.get("total_urls", 0)
-            job.processed_urls = result.get("processed_urls", 0)
-            job.successful_urls = result.get("successful_urls", 0)
-            job.failed_urls = result.get("failed_urls", 0)
-            job.new_scholarships = result.get("new_scholarships", 0)
-            job.updated_scholarships = result.get("updated_scholarships", 0)
-            job.metadata = result.get("metadata", {})
-
-            db.commit()
 
-            logger.info(
-                f"Government scraping completed. New: {job.new_scholarships}, Updated: {job.updated_scholarships}")
+@app.task(bind=True, name="app.tasks.scraping_tasks.scrape_nsp_scholarships")
+def scrape_nsp_scholarships(self, force_update: bool = False):
+    """Scrape scholarships from NSP (National Scholarship Portal)."""
+    return _run_scrape(self, "NSP", {"force_update": force_update})
 
-            return {
-                "status": "success",
-                "job_id": job.id,
-                "new_scholarships": job.new_scholarships,
-                "updated_scholarships": job.updated_scholarships,
-                "total_processed": job.processed_urls
-            }
 
-    except Exception as e:
-        logger.error(f"Error in government scraping task: {str(e)}")
+@app.task(bind=True, name="app.tasks.scraping_tasks.scrape_ugc_scholarships")
+def scrape_ugc_scholarships(self, force_update: bool = False):
+    """Scrape scholarships from UGC sources."""
+    return _run_scrape(self, "UGC", {"force_update": force_update})
 
-        try:
-            with get_db_session() as db:
-                job = db.query(ScrapingJob).filter(
-                    ScrapingJob.id == self.request.id).first()
-                if job:
-                    job.status = "failed"
-                    job.completed_at = datetime.utcnow()
-                    job.errors = [str(e)]
-                    db.commit()
-        except:
-            pass
 
-        raise self.retry(exc=e, countdown=300, max_retries=3)
+@app.task(bind=True, name="app.tasks.scraping_tasks.scrape_government_scholarships")
+def scrape_government_scholarships(self, force_update: bool = False):
+    """Scrape scholarships from various government sources."""
+    return _run_scrape(self, "GOVERNMENT", {"force_update": force_update})
 
 
 @app.task(bind=True, name="app.tasks.scraping_tasks.scrape_single_source")
 def scrape_single_source(self, source_url: str, source_name: str):
     """Scrape a single scholarship source."""
-    try:
-        with get_db_session() as db:
-            job = ScrapingJob(
-                id=self.request.id,
-                source=source_name,
-                status="running",
-                started_at=datetime.utcnow(),
-                metadata={"source_url": source_url}
-            )
-            db.add(job)
-            db.commit()
-
-            scraping_service = ScrapingService(db)
-
-            logger.info(f"Starting scraping for {source_name}: {source_url}")
-            result = asyncio.run(
-                scraping_service.scrape_single_source(source_url))
-
-            # Update job status
-            job.status = "completed"
-            job.completed_at = datetime.utcnow()
-            job.total_urls = result.get("total_urls", 0)
-            job.processed_urls = result.get("processed_urls", 0)
-            job.successful_urls = result.get("successful_urls", 0)
-            job.failed_urls = result.get("failed_urls", 0)
-            job.new_scholarships = result.get("new_scholarships", 0)
-            job.updated_scholarships = result.get("updated_scholarships", 0)
-            job.metadata = result.get("metadata", {})
-
-            db.commit()
-
-            logger.info(
-                f"{source_name} scraping completed. New: {job.new_scholarships}, Updated: {job.updated_scholarships}")
-
-            return {
-                "status": "success",
-                "job_id": job.id,
-                "source": source_name,
-                "new_scholarships": job.new_scholarships,
-                "updated_scholarships": job.updated_scholarships,
-                "total_processed": job.processed_urls
-            }
-
-    except Exception as e:
-        logger.error(f"Error in single source scraping task: {str(e)}")
-
-        try:
-            with get_db_session() as db:
-                job = db.query(ScrapingJob).filter(
-                    ScrapingJob.id == self.request.id).first()
-                if job:
-                    job.status = "failed"
-                    job.completed_at = datetime.utcnow()
-                    job.errors = [str(e)]
-                    db.commit()
-        except:
-            pass
-
-        raise self.retry(exc=e, countdown=300, max_retries=3)
+    return _run_scrape(self, source_name, {"source_url": source_url}, source_url)
 
 
 @app.task(bind=True, name="app.tasks.scraping_tasks.update_scholarship_quality_scores")
 def update_scholarship_quality_scores(self):
     """Update quality scores for all scholarships."""
     try:
+        validation_service = get_validation_service()
+        chunk_size = settings.VALIDATION_CHUNK_SIZE
         with get_db_session() as db:
-            # Get all active scholarships
-            scholarships = db.query(Scholarship).filter(
+            total = db.query(func.count(Scholarship.id)).filter(
                 Scholarship.is_active == True
-            ).all()
-
-            validation_service = LinkValidationService()
-            updated_count = 0
-
-            for scholarship in scholarships:
-                try:
-                    # Validate the official URL
-                    if scholarship.official_url:
-                        result = asyncio.run(
-                            validation_service.validate_url(scholarship.official_url))
-
-                        # Update quality score and validation status
-                        scholarship.quality_score = result.quality_score
-                        scholarship.link_validated = result.status == "valid"
-                        scholarship.last_validated = datetime.utcnow()
-
-                        updated_count += 1
-
-                        # Update progress
-                        current_task.update_state(
-                            state="PROGRESS",
-                            meta={
-                                "current": updated_count,
-                                "total": len(scholarships),
-                                "status": f"Updated {updated_count}/{len(scholarships)} scholarships"
-                            }
-                        )
-
-                except Exception as e:
-                    logger.error(
-                        f"Error updating scholarship {scholarship.id}: {str(e)}")
-                    continue
-
-            db.commit()
+            ).scalar()
+
+        # Walk active scholarships in id order one chunk at a time (keyset
+        # pagination rather than a server-side cursor, which would not
+        # survive the per-chunk commit), so at most one chunk of (id, url)
+        # tuples is held and each chunk's writes are committed before the
+        # next is fetched. The read and the write each use a short session,
+        # so no connection sits idle in a transaction while URLs are fetched.
+        processed = 0
+        updated_count = 0
+        last_id = None
+        while True:
+            with get_db_session() as db:
+                query = db.query(Scholarship.id, Scholarship.application_url).filter(
+                    Scholarship.is_active == True
+                )
+                if last_id is not None:
+                    query = query.filter(Scholarship.id > last_id)
+                chunk = query.order_by(Scholarship.id).limit(chunk_size).all()
+            if not chunk:
+                break
+            last_id = chunk[-1][0]
+            processed += len(chunk)
+
+            # Scholarships often share a portal URL; fetch each URL once.
+            # Repeats across chunks are served by the validation cache.
+            by_url = {}
+            for scholarship_id, application_url in chunk:
+                if application_url:
+                    by_url.setdefault(application_url, []).append(scholarship_id)
+            urls = list(by_url)
+
+            # Validate the chunk's unique URLs in one concurrent batch
+            results = run_async(validation_service.validate_urls(urls))
+
+            # Update quality score and validation status in one bulk
+            # UPDATE keyed by primary key
+            validated_at = datetime.utcnow()
+            rows = [
+                {
+                    "id": scholarship_id,
+                    "quality_score": result.quality_score,
+                    "validation_status": result.status.value,
+                    "last_validated": validated_at
+                }
+                for url, result in zip(urls, results)
+                if result is not None
+                for scholarship_id in by_url[url]
+            ]
+            with get_db_session() as db:
+                bulk_update_by_id(db, Scholarship, rows)
+                db.commit()
+            updated_count += len(rows)
+
+            current_task.update_state(
+                state="PROGRESS",
+                meta={
+                    "current": processed,
+                    "total": total,
+                    "status": f"Updated {updated_count}/{total} scholarships"
+                }
+            )
 
-            logger.info(
-                f"Updated quality scores for {updated_count} scholarships")
+        logger.info(
+            f"Updated quality scores for {updated_count} scholarships")
 
-            return {
-                "status": "success",
-                "updated_count": updated_count,
-                "total_scholarships": len(scholarships)
-            }
+        return {
+            "status": "success",
+            "updated_count": updated_count,
+            "total_scholarships": total
+        }
 
     except Exception as e:
         logger.error(f"Error in quality score update task: {str(e)}")
         raise self.retry(exc=e, countdown=300, max_retries=3)
 
 
-@app.task(bind=True, name="app.tasks.scraping_tasks.cleanup_failed_jobs")
+@app.task(bind=True, ignore_result=True, name="app.tasks.scraping_tasks.cleanup_failed_jobs")
 def cleanup_failed_jobs(self):
     """Clean up old failed scraping jobs."""
     try:
         with get_db_session() as db:
+            set_async_commit(db)
+
             # Delete failed jobs older than 7 days
             cutoff_date = datetime.utcnow() - timedelta(days=7)
 
             deleted_count = db.query(ScrapingJob).filter(
                 ScrapingJob.status == "failed",
                 ScrapingJob.created_at < cutoff_date
-            ).delete()
+            ).delete(synchronize_session=False)
 
             db.commit()
 
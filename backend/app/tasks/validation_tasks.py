@@ -3,86 +3,133 @@ Background tasks for validating scholarship data and links.
 """
 
 from ..models.models import Scholarship, ValidationResult
-from ..services.validation_service import ValidationService, LinkValidationService
-from ..core.database import get_db_session
+from ..services.validation_service import ValidationService, LinkStatus, get_validation_service
+from ..core.database import get_db_session, set_async_commit, bulk_update_by_id
+from ..core.worker_runtime import run_async
+from ..core.config import settings
 from celery_app import app
-import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from celery import current_task
+from celery import current_task, group
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-
-# Import celery app from parent directory
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sqlalchemy import and_, or_, insert, update
 
 logger = logging.getLogger(__name__)
 
 
 @app.task(bind=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
-def validate_scholarship_links(self, scholarship_ids: List[int]) -> Dict[str, Any]:
+def validate_scholarship_links(self, scholarship_ids: List[int],
+                               queued_at: Optional[str] = None) -> Dict[str, Any]:
     """
     Validate scholarship links in background.
 
+    Scholarships are processed in chunks of VALIDATION_LINKS_CHUNK_SIZE,
+    each validated, written and committed before the next, so a killed
+    worker loses at most one chunk.
+
     Args:
         scholarship_ids: List of scholarship IDs to validate
+        queued_at: ISO timestamp of when the batch was queued. Scholarships
+            validated after it are skipped, so a retried or redelivered task
+            does not validate committed chunks again or duplicate their
+            ValidationResult rows.
 
     Returns:
-        Dict with validation results
+        Dict with validation counts
     """
     try:
-        with get_db_session() as db:
-            validation_service = LinkValidationService(db)
-            results = []
-
-            for scholarship_id in scholarship_ids:
-                scholarship = db.query(Scholarship).filter(
-                    Scholarship.id == scholarship_id
-                ).first()
-
-                if not scholarship:
+        validation_service = get_validation_service()
+        chunk_size = settings.VALIDATION_LINKS_CHUNK_SIZE
+        since = datetime.fromisoformat(queued_at) if queued_at else None
+        total = len(scholarship_ids)
+        processed = 0
+        valid_count = 0
+
+        for start in range(0, total, chunk_size):
+            chunk_ids = scholarship_ids[start:start + chunk_size]
+
+            # Load the chunk's (id, url) pairs in one query, keeping the
+            # order of scholarship_ids. The session is closed before the
+            # URLs are fetched so its connection goes back to the pool.
+            with get_db_session() as db:
+                query = db.query(Scholarship.id, Scholarship.application_url,
+                                 Scholarship.last_validated).filter(
+                    Scholarship.id.in_(chunk_ids)
+                )
+                found = {
+                    scholarship_id: (url, last_validated)
+                    for scholarship_id, url, last_validated in query
+                }
+            scholarships = []
+            for scholarship_id in chunk_ids:
+                if scholarship_id not in found:
                     logger.warning(f"Scholarship {scholarship_id} not found")
                     continue
+                url, last_validated = found[scholarship_id]
+                if not url:
+                    continue
+                if since is not None and last_validated is not None and last_validated > since:
+                    continue
+                scholarships.append((scholarship_id, url))
+
+            # Each distinct URL is fetched once and its result shared;
+            # only reachability is recorded here, so a HEAD request is
+            # enough. DB writes stay out of the async code.
+            urls = list(dict.fromkeys(url for _, url in scholarships))
+            validation_results = dict(zip(urls, run_async(
+                validation_service.validate_urls(urls, fetch_content=False))))
+
+            validation_records = []
+            scholarship_updates = []
+            validated_at = datetime.utcnow()
+
+            for scholarship_id, url in scholarships:
+                validation_result = validation_results[url]
+                if validation_result is None:
+                    continue
 
-                # Validate main URL
-                validation_result = asyncio.run(
-                    validation_service.validate_url(scholarship.url)
-                )
-
-                # Update scholarship with validation result
-                scholarship.is_valid = validation_result.is_valid
-                scholarship.last_validated = datetime.utcnow()
-
-                # Store validation result
-                validation_record = ValidationResult(
-                    scholarship_id=scholarship.id,
-                    url=scholarship.url,
-                    is_valid=validation_result.is_valid,
-                    status_code=validation_result.status_code,
-                    error_message=validation_result.error_message,
-                    validated_at=datetime.utcnow()
-                )
-                db.add(validation_record)
-                results.append(validation_result.dict())
-
-                # Update task progress
-                current_task.update_state(
-                    state='PROGRESS',
-                    meta={'processed': len(
-                        results), 'total': len(scholarship_ids)}
-                )
-
-            db.commit()
+                # A redirect that resolves is still a working link
+                is_valid = validation_result.status in (LinkStatus.VALID, LinkStatus.REDIRECT)
+                issues = validation_result.issues
+
+                scholarship_updates.append({
+                    'id': scholarship_id,
+                    'validation_status': validation_result.status.value,
+                    'validation_errors': issues or None,
+                    'last_validated': validated_at
+                })
+                validation_records.append({
+                    'scholarship_id': scholarship_id,
+                    'url': url,
+                    'is_valid': is_valid,
+                    'status_code': validation_result.response_code,
+                    'error_message': "; ".join(issues) or None,
+                    'validated_at': validated_at
+                })
+                if is_valid:
+                    valid_count += 1
+
+            if scholarship_updates:
+                with get_db_session() as db:
+                    bulk_update_by_id(db, Scholarship, scholarship_updates)
+                    db.execute(insert(ValidationResult), validation_records)
+                    db.commit()
+            processed += len(validation_records)
+
+            # Update task progress once per chunk
+            current_task.update_state(
+                state='PROGRESS',
+                meta={'processed': processed, 'total': total}
+            )
 
-            return {
-                'status': 'completed',
-                'processed': len(results),
-                'total': len(scholarship_ids),
-                'results': results
-            }
+        return {
+            'status': 'completed',
+            'processed': processed,
+            'valid': valid_count,
+            'invalid': processed - valid_count,
+            'total': total
+        }
 
     except Exception as e:
         logger.error(f"Error validating scholarship links: {str(e)}")
@@ -135,7 +182,7 @@ def validate_scholarship_data(self, scholarship_id: int) -> Dict[str, Any]:
         raise self.retry(exc=e, countdown=60)
 
 
-@app.task(bind=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
+@app.task(bind=True, ignore_result=True, retry_backoff=True, retry_kwargs={'max_retries': 3})
 def cleanup_invalid_scholarships(self) -> Dict[str, Any]:
     """
     Clean up invalid or expired scholarships.
@@ -145,33 +192,30 @@ def cleanup_invalid_scholarships(self) -> Dict[str, Any]:
     """
     try:
         with get_db_session() as db:
-            # Remove scholarships with invalid URLs for more than 30 days
+            # Cleanup can simply be re-run, so skip the per-commit WAL flush
+            set_async_commit(db)
+
+            # Remove scholarships with invalid URLs for more than 30 days,
+            # in one DELETE without loading them
             cutoff_date = datetime.utcnow() - timedelta(days=30)
 
-            invalid_scholarships = db.query(Scholarship).filter(
+            removed_count = db.query(Scholarship).filter(
                 and_(
-                    Scholarship.is_valid == False,
+                    Scholarship.validation_status.in_(
+                        (LinkStatus.INVALID.value, LinkStatus.BROKEN.value)),
                     Scholarship.last_validated <= cutoff_date
                 )
-            ).all()
-
-            removed_count = 0
-            for scholarship in invalid_scholarships:
-                db.delete(scholarship)
-                removed_count += 1
-
-            # Mark expired scholarships as inactive
-            expired_scholarships = db.query(Scholarship).filter(
-                and_(
-                    Scholarship.deadline < datetime.utcnow(),
-                    Scholarship.is_active == True
-                )
-            ).all()
-
-            deactivated_count = 0
-            for scholarship in expired_scholarships:
-                scholarship.is_active = False
-                deactivated_count += 1
+            ).delete(synchronize_session=False)
+
+            # Mark expired scholarships as inactive in one UPDATE
+            deactivated_count = db.execute(
+                update(Scholarship).where(
+                    and_(
+                        Scholarship.deadline < datetime.utcnow(),
+                        Scholarship.is_active == True
+                    )
+                ).values(is_active=False).execution_options(synchronize_session=False)
+            ).rowcount
 
             db.commit()
 
@@ -200,28 +244,35 @@ def batch_validate_scholarships(self, batch_size: int = 100) -> Dict[str, Any]:
     try:
         with get_db_session() as db:
             # Get scholarships that need validation
-            scholarships_to_validate = db.query(Scholarship).filter(
-                or_(
-                    Scholarship.last_validated.is_(None),
-                    Scholarship.last_validated <= datetime.utcnow() - timedelta(days=7)
-                )
-            ).limit(batch_size).all()
-
-            if not scholarships_to_validate:
+            scholarship_ids = [
+                scholarship_id for (scholarship_id,) in db.query(Scholarship.id).filter(
+                    or_(
+                        Scholarship.last_validated.is_(None),
+                        Scholarship.last_validated <= datetime.utcnow() - timedelta(days=7)
+                    )
+                ).limit(batch_size)
+            ]
+
+            if not scholarship_ids:
                 return {
                     'status': 'completed',
                     'message': 'No scholarships need validation'
                 }
 
-            scholarship_ids = [s.id for s in scholarships_to_validate]
-
-            # Queue validation task
-            validate_scholarship_links.delay(scholarship_ids)
+            # Fan out one validation task per chunk of ids so the chunks
+            # spread across the prefetch=1 workers instead of running as one
+            # long task
+            chunk_size = settings.VALIDATION_LINKS_CHUNK_SIZE
+            queued_at = datetime.utcnow().isoformat()
+            group(
+                validate_scholarship_links.s(
+                    scholarship_ids[i:i + chunk_size], queued_at=queued_at)
+                for i in range(0, len(scholarship_ids), chunk_size)
+            ).apply_async()
 
             return {
                 'status': 'queued',
-                'batch_size': len(scholarship_ids),
-                'scholarship_ids': scholarship_ids
+                'batch_size': len(scholarship_ids)
             }
 
     except Exception as e:
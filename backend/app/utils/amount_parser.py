@@ -5,29 +5,89 @@ Amount parser utility for extracting and normalizing monetary amounts.
 import re
 import logging
 from typing import Optional, Dict, Any, Tuple, List
-from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import rather than looked up in re's cache
+# on every parse
+_RUPEE_RE = re.compile(r'(?:₹|rs\.?|rupees?|inr)\s*(\d+(?:,\d+)*(?:\.\d+)?)', re.IGNORECASE)
+# Crore, lakh, thousand and plain amounts in one alternation, so the text is
+# scanned once; the named group that matched says which multiplier applies
+_MULTIPLIED_AMOUNT_RE = re.compile(
+    r'(?P<crore>\d+(?:\.\d+)?)\s*crores?'
+    r'|(?P<lakh>\d+(?:\.\d+)?)\s*(?:lakh|lac)s?'
+    r'|(?P<thousand>\d+(?:\.\d+)?)\s*(?:thousand|k)'
+    r'|(?P<numeric>\d+(?:,\d+)*(?:\.\d+)?)',
+    re.IGNORECASE
+)
+# Multiplier for each group, in order of preference
+_AMOUNT_MULTIPLIERS = {
+    'crore': 10000000,
+    'lakh': 100000,
+    'thousand': 1000,
+    'numeric': 1
+}
+# Word tokens for the number-word lexer; digits are kept as tokens so they
+# end a phrase rather than being skipped over
+_WORD_TOKEN_RE = re.compile(r'[a-z0-9]+')
+# "X to Y" / "X - Y" (which also covers "from X to Y") is preferred over
+# "between X and Y". Each alternative is wrapped in its own outer group so
+# that match.lastgroup names the alternative.
+_RANGE_RE = re.compile(
+    r'(?P<to>\d+(?:,\d+)*\s*(?:to|-)\s*(?P<to_max>\d+(?:,\d+)*))'
+    r'|(?P<between>between\s+\d+(?:,\d+)*\s+and\s+(?P<between_max>\d+(?:,\d+)*))',
+    re.IGNORECASE
+)
+_RANGE_PREFERENCE = ('to', 'between')
+# Sentences end at . ! ? or ;. The other three are translated to '.' so a
+# plain str.split does the splitting, without the regex engine.
+_SENTENCE_END_TABLE = str.maketrans('!?;', '...')
+# Amount type and payment frequency keywords, one alternation per category
+# with a named group per label. Each alternative is a lookahead so keywords
+# inside other keywords ("award" in "reward") are still seen, as with the
+# substring checks these replace.
+_AMOUNT_TYPE_RE = re.compile(
+    r'(?=(?P<scholarship>scholarship|award|grant))'
+    r'|(?=(?P<stipend>stipend|monthly|per month))'
+    r'|(?=(?P<fee>fee|tuition|cost))'
+    r'|(?=(?P<prize>prize|reward|cash))'
+)
+_AMOUNT_TYPE_PREFERENCE = ('scholarship', 'stipend', 'fee', 'prize')
+_FREQUENCY_RE = re.compile(
+    r'(?=(?P<monthly>monthly|per month|/month))'
+    r'|(?=(?P<yearly>yearly|per year|/year|annual))'
+    r'|(?=(?P<one_time>one time|lump sum|single))'
+)
+_FREQUENCY_PREFERENCE = ('monthly', 'yearly', 'one_time')
+# Every strategy needs a digit or a multiplier word; text with neither
+# cannot hold an amount
+_AMOUNT_HINT_RE = re.compile(r'\d|lakh|crore|thousand|hundred')
+
+
+def _preferred_match(pattern: re.Pattern, text: str, preference) -> Optional[re.Match]:
+    """
+    First match of the most preferred alternative of `pattern` in one scan
+
+    `preference` lists the top-level named groups of the pattern, most
+    preferred first.
+    """
+    best = None
+    best_rank = len(preference)
+    for match in pattern.finditer(text):
+        rank = preference.index(match.lastgroup)
+        if rank < best_rank:
+            best, best_rank = match, rank
+            if rank == 0:
+                break
+    return best
+
 
 class AmountParser:
     """Utility class for parsing monetary amounts from text."""
 
     def __init__(self):
-        self.currency_patterns = self._init_currency_patterns()
         self.word_to_number = self._init_word_to_number()
 
-    def _init_currency_patterns(self) -> Dict[str, str]:
-        """Initialize currency patterns."""
-        return {
-            'rupees': r'(?:₹|rs\.?|rupees?|inr)\s*(\d+(?:,\d+)*(?:\.\d+)?)',
-            'lakhs': r'(\d+(?:\.\d+)?)\s*(?:lakh|lac)s?',
-            'crores': r'(\d+(?:\.\d+)?)\s*crores?',
-            'thousands': r'(\d+(?:\.\d+)?)\s*(?:thousand|k)',
-            'numeric': r'(\d+(?:,\d+)*(?:\.\d+)?)',
-            'words': r'(one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety|hundred|thousand|lakh|lac|crore)'
-        }
-
     def _init_word_to_number(self) -> Dict[str, int]:
         """Initialize word to number mapping."""
         return {
@@ -56,6 +116,10 @@ class AmountParser:
 
         text = text.lower().strip()
 
+        # Most sentences hold no amount; rule them out with one cheap scan
+        if not _AMOUNT_HINT_RE.search(text):
+            return None
+
         # Try different parsing strategies
         strategies = [
             self._parse_structured_amount,
@@ -68,103 +132,83 @@ class AmountParser:
             try:
                 amount = strategy(text)
                 if amount is not None:
-                    return float(amount)
+                    return amount
             except Exception as e:
                 logger.debug(f"Amount parsing strategy failed: {str(e)}")
                 continue
 
         return None
 
-    def _parse_structured_amount(self, text: str) -> Optional[Decimal]:
+    def _parse_structured_amount(self, text: str) -> Optional[float]:
         """Parse structured amount with currency symbols."""
         # Look for rupee amounts
-        rupee_pattern = self.currency_patterns['rupees']
-        match = re.search(rupee_pattern, text, re.IGNORECASE)
+        match = _RUPEE_RE.search(text)
 
         if match:
             amount_str = match.group(1).replace(',', '')
-            return Decimal(amount_str)
+            return round(float(amount_str), 2)
 
         return None
 
-    def _parse_word_amount(self, text: str) -> Optional[Decimal]:
+    def _parse_word_amount(self, text: str) -> Optional[float]:
         """Parse amount expressed in words."""
-        # Look for patterns like "five lakh", "ten thousand", etc.
-        patterns = [
-            r'(\w+)\s+lakh',
-            r'(\w+)\s+crore',
-            r'(\w+)\s+thousand',
-            r'(\w+)\s+hundred'
-        ]
+        # Walk the words once, accumulating the first number phrase that has
+        # a multiplier: "five lakh", "ten thousand", "two hundred",
+        # "one lakh fifty thousand". Multipliers without a number word
+        # before them are ignored.
+        word_to_number = self.word_to_number
+        total = 0
+        current = 0
+        scaled = False
+
+        for token in _WORD_TOKEN_RE.findall(text):
+            value = word_to_number.get(token)
+            if value is None:
+                if token == 'and' and (current or scaled):
+                    continue
+                if scaled:
+                    break
+                # A phrase without a multiplier is not an amount
+                total = current = 0
+                continue
+
+            if value == 100:
+                if current:
+                    current *= 100
+                    scaled = True
+            elif value >= 1000:
+                if current:
+                    total += current * value
+                    current = 0
+                    scaled = True
+            else:
+                current += value
 
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                word = match.lower()
-                if word in self.word_to_number:
-                    base_value = self.word_to_number[word]
-
-                    # Determine multiplier
-                    if 'lakh' in text:
-                        return Decimal(base_value * 100000)
-                    elif 'crore' in text:
-                        return Decimal(base_value * 10000000)
-                    elif 'thousand' in text:
-                        return Decimal(base_value * 1000)
-                    elif 'hundred' in text:
-                        return Decimal(base_value * 100)
+        if scaled:
+            return float(total + current)
 
         return None
 
-    def _parse_numeric_amount(self, text: str) -> Optional[Decimal]:
+    def _parse_numeric_amount(self, text: str) -> Optional[float]:
         """Parse numeric amount with multipliers."""
-        # Look for patterns like "5 lakh", "10 crore", etc.
-        lakh_pattern = self.currency_patterns['lakhs']
-        crore_pattern = self.currency_patterns['crores']
-        thousand_pattern = self.currency_patterns['thousands']
-
-        # Check for crores
-        match = re.search(crore_pattern, text, re.IGNORECASE)
+        # Look for patterns like "5 lakh", "10 crore", etc. Crores are
+        # preferred over lakhs, then thousands, then plain numbers.
+        match = _preferred_match(_MULTIPLIED_AMOUNT_RE, text, tuple(_AMOUNT_MULTIPLIERS))
         if match:
-            amount = Decimal(match.group(1))
-            return amount * 10000000
-
-        # Check for lakhs
-        match = re.search(lakh_pattern, text, re.IGNORECASE)
-        if match:
-            amount = Decimal(match.group(1))
-            return amount * 100000
-
-        # Check for thousands
-        match = re.search(thousand_pattern, text, re.IGNORECASE)
-        if match:
-            amount = Decimal(match.group(1))
-            return amount * 1000
-
-        # Check for plain numbers
-        numeric_pattern = self.currency_patterns['numeric']
-        match = re.search(numeric_pattern, text)
-        if match:
-            amount_str = match.group(1).replace(',', '')
-            return Decimal(amount_str)
+            kind = match.lastgroup
+            amount = float(match.group(kind).replace(',', ''))
+            # Round off binary float drift: 1.1 * 100000 is 110000.00000000001
+            return round(amount * _AMOUNT_MULTIPLIERS[kind], 2)
 
         return None
 
-    def _parse_range_amount(self, text: str) -> Optional[Decimal]:
+    def _parse_range_amount(self, text: str) -> Optional[float]:
         """Parse amount ranges and return the maximum."""
         # Look for patterns like "5000 to 10000", "Rs. 1000 - 5000", etc.
-        range_patterns = [
-            r'(\d+(?:,\d+)*)\s*(?:to|-)\s*(\d+(?:,\d+)*)',
-            r'between\s+(\d+(?:,\d+)*)\s+and\s+(\d+(?:,\d+)*)',
-            r'from\s+(\d+(?:,\d+)*)\s+to\s+(\d+(?:,\d+)*)'
-        ]
-
-        for pattern in range_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                min_amount = Decimal(match.group(1).replace(',', ''))
-                max_amount = Decimal(match.group(2).replace(',', ''))
-                return max_amount  # Return the maximum amount
+        match = _preferred_match(_RANGE_RE, text, _RANGE_PREFERENCE)
+        if match:
+            # Return the maximum amount
+            return float(match.group(f'{match.lastgroup}_max').replace(',', ''))
 
         return None
 
@@ -195,24 +239,16 @@ class AmountParser:
             result['amount'] = amount
             result['confidence'] = 0.8
 
-        # Determine amount type
+        # Determine amount type and frequency, one scan each
         text_lower = text.lower()
-        if any(word in text_lower for word in ['scholarship', 'award', 'grant']):
-            result['type'] = 'scholarship'
-        elif any(word in text_lower for word in ['stipend', 'monthly', 'per month']):
-            result['type'] = 'stipend'
-        elif any(word in text_lower for word in ['fee', 'tuition', 'cost']):
-            result['type'] = 'fee'
-        elif any(word in text_lower for word in ['prize', 'reward', 'cash']):
-            result['type'] = 'prize'
+        match = _preferred_match(_AMOUNT_TYPE_RE, text_lower, _AMOUNT_TYPE_PREFERENCE)
+        if match:
+            result['type'] = match.lastgroup
 
         # Check for frequency
-        if any(word in text_lower for word in ['monthly', 'per month', '/month']):
-            result['frequency'] = 'monthly'
-        elif any(word in text_lower for word in ['yearly', 'per year', '/year', 'annual']):
-            result['frequency'] = 'yearly'
-        elif any(word in text_lower for word in ['one time', 'lump sum', 'single']):
-            result['frequency'] = 'one_time'
+        match = _preferred_match(_FREQUENCY_RE, text_lower, _FREQUENCY_PREFERENCE)
+        if match:
+            result['frequency'] = match.lastgroup
 
         return result
 
@@ -254,7 +290,7 @@ class AmountParser:
         amounts = []
 
         # Split text into sentences
-        sentences = re.split(r'[.!?;]', text)
+        sentences = text.translate(_SENTENCE_END_TABLE).split('.')
 
         for sentence in sentences:
             sentence = sentence.strip()
@@ -7,6 +7,38 @@ from datetime import datetime, timedelta
 from typing import Optional, List
 import calendar
 
+# Sentences end at . ! ? or ;. The other three are translated to '.' so a
+# plain str.split does the splitting, without the regex engine.
+_SENTENCE_END_TABLE = str.maketrans('!?;', '...')
+
+# Patterns are compiled once at import rather than per call
+_INDIAN_DATE_RE = re.compile(r'(\d{1,2})[^\w]*(\w+)[^\w]*(\d{2,4})')
+_DEADLINE_DATE_RES = [
+    re.compile(r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})\b'),
+    re.compile(r'\b(\d{1,2})\s+(\w+)\s+(\d{2,4})\b'),
+    re.compile(r'\b(\w+)\s+(\d{1,2}),?\s+(\d{2,4})\b'),
+]
+
+# Deadline keywords, matched as substrings in one scan per sentence
+_DEADLINE_KEYWORDS = (
+    'deadline', 'last date', 'closing date', 'due date', 'final date',
+    'submission date', 'application closes', 'before', 'by', 'until'
+)
+_DEADLINE_KEYWORD_RE = re.compile('|'.join(map(re.escape, _DEADLINE_KEYWORDS)))
+
+# "X days ago", "in X weeks", ... as (pattern, offset from now for X)
+_RELATIVE_DATE_RES = [
+    (re.compile(r'(\d+)\s*days?\s*ago'), lambda x: -timedelta(days=x)),
+    (re.compile(r'(\d+)\s*weeks?\s*ago'), lambda x: -timedelta(weeks=x)),
+    (re.compile(r'(\d+)\s*months?\s*ago'), lambda x: -timedelta(days=x * 30)),
+    (re.compile(r'(\d+)\s*days?\s*from\s*now'), lambda x: timedelta(days=x)),
+    (re.compile(r'(\d+)\s*weeks?\s*from\s*now'), lambda x: timedelta(weeks=x)),
+    (re.compile(r'(\d+)\s*months?\s*from\s*now'), lambda x: timedelta(days=x * 30)),
+    (re.compile(r'in\s*(\d+)\s*days?'), lambda x: timedelta(days=x)),
+    (re.compile(r'in\s*(\d+)\s*weeks?'), lambda x: timedelta(weeks=x)),
+    (re.compile(r'in\s*(\d+)\s*months?'), lambda x: timedelta(days=x * 30)),
+]
+
 
 def parse_date(date_string: str) -> Optional[datetime]:
     """Parse date string into datetime object."""
@@ -84,24 +116,11 @@ def parse_relative_date(date_string: str) -> Optional[datetime]:
         return now.replace(year=now.year - 1)
 
     # X days/weeks/months ago/from now
-    time_patterns = [
-        (r'(\d+)\s*days?\s*ago', lambda x: now - timedelta(days=int(x))),
-        (r'(\d+)\s*weeks?\s*ago', lambda x: now - timedelta(weeks=int(x))),
-        (r'(\d+)\s*months?\s*ago', lambda x: now - timedelta(days=int(x) * 30)),
-        (r'(\d+)\s*days?\s*from\s*now', lambda x: now + timedelta(days=int(x))),
-        (r'(\d+)\s*weeks?\s*from\s*now', lambda x: now + timedelta(weeks=int(x))),
-        (r'(\d+)\s*months?\s*from\s*now',
-         lambda x: now + timedelta(days=int(x) * 30)),
-        (r'in\s*(\d+)\s*days?', lambda x: now + timedelta(days=int(x))),
-        (r'in\s*(\d+)\s*weeks?', lambda x: now + timedelta(weeks=int(x))),
-        (r'in\s*(\d+)\s*months?', lambda x: now + timedelta(days=int(x) * 30)),
-    ]
-
-    for pattern, calculator in time_patterns:
-        match = re.search(pattern, date_string)
+    for pattern, offset in _RELATIVE_DATE_RES:
+        match = pattern.search(date_string)
         if match:
             try:
-                return calculator(match.group(1))
+                return now + offset(int(match.group(1)))
             except (ValueError, OverflowError):
                 continue
 
@@ -127,8 +146,7 @@ def parse_indian_date(date_string: str) -> Optional[datetime]:
     }
 
     # Try to extract day, month, year
-    date_pattern = r'(\d{1,2})[^\w]*(\w+)[^\w]*(\d{2,4})'
-    match = re.search(date_pattern, date_string.lower())
+    match = _INDIAN_DATE_RE.search(date_string.lower())
 
     if match:
         try:
@@ -168,21 +186,12 @@ def extract_deadline_from_text(text: str) -> Optional[datetime]:
 
     text = text.lower()
 
-    # Look for deadline keywords
-    deadline_keywords = [
-        'deadline', 'last date', 'closing date', 'due date', 'final date',
-        'submission date', 'application closes', 'before', 'by', 'until'
-    ]
-
     # Find sentences containing deadline keywords
-    sentences = re.split(r'[.!?;]', text)
-    deadline_sentences = []
-
-    for sentence in sentences:
-        for keyword in deadline_keywords:
-            if keyword in sentence:
-                deadline_sentences.append(sentence.strip())
-                break
+    sentences = text.translate(_SENTENCE_END_TABLE).split('.')
+    deadline_sentences = [
+        sentence.strip() for sentence in sentences
+        if _DEADLINE_KEYWORD_RE.search(sentence)
+    ]
 
     # Try to extract dates from deadline sentences
     for sentence in deadline_sentences:
@@ -191,14 +200,8 @@ def extract_deadline_from_text(text: str) -> Optional[datetime]:
             return date
 
         # Look for date patterns in the sentence
-        date_patterns = [
-            r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})\b',
-            r'\b(\d{1,2})\s+(\w+)\s+(\d{2,4})\b',
-            r'\b(\w+)\s+(\d{1,2}),?\s+(\d{2,4})\b',
-        ]
-
-        for pattern in date_patterns:
-            matches = re.findall(pattern, sentence)
+        for pattern in _DEADLINE_DATE_RES:
+            matches = pattern.findall(sentence)
             for match in matches:
                 try:
                     date = parse_date(' '.join(match))
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 import re
 import difflib
+import hashlib
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
@@ -71,6 +72,22 @@ class DuplicationDetector:
         result = self.detect_duplication(scholarship1, scholarship2)
         return result.is_duplicate
 
+    def title_hash(self, title: str, source: str) -> str:
+        """
+        Compute the exact-match hash stored in ``Scholarship.title_hash``.
+
+        Args:
+            title: Scholarship title
+            source: Source name the scholarship was scraped from
+
+        Returns:
+            Hex SHA-1 of the lowercased title and source
+        """
+        # Unit separator between the fields so ("ab", "cd") and ("abc", "d")
+        # hash differently
+        key = f"{(title or '').strip().lower()}\x1f{source or ''}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
     def detect_duplication(
         self,
         scholarship1: Dict[str, Any],
@@ -7,6 +7,66 @@ from typing import List, Optional
 from html import unescape
 import unicodedata
 
+# Lookup tables are built once at import rather than on every call.
+# Common stop words dropped by extract_keywords:
+_STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
+    'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
+    'those', 'is', 'are', 'was', 'were', 'been', 'being', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
+    'might', 'must', 'can', 'shall'
+})
+
+# Common variations of scholarship categories mapped to standard names
+_CATEGORY_MAPPING = {
+    'merit': 'Merit',
+    'merit-cum-means': 'Merit-cum-Means',
+    'merit cum means': 'Merit-cum-Means',
+    'means': 'Means',
+    'need based': 'Need-based',
+    'need-based': 'Need-based',
+    'sc': 'SC/ST',
+    'st': 'SC/ST',
+    'sc/st': 'SC/ST',
+    'obc': 'OBC',
+    'minority': 'Minority',
+    'central government': 'Central Government',
+    'state government': 'State Government',
+    'private': 'Private',
+    'research': 'Research',
+    'fellowship': 'Fellowship',
+    'international': 'International'
+}
+
+# Common spellings of education levels mapped to standard names
+_LEVEL_MAPPING = {
+    'undergraduate': 'Undergraduate',
+    'ug': 'Undergraduate',
+    'bachelor': 'Undergraduate',
+    'bachelors': 'Undergraduate',
+    'btech': 'Undergraduate',
+    'be': 'Undergraduate',
+    'bsc': 'Undergraduate',
+    'ba': 'Undergraduate',
+    'bcom': 'Undergraduate',
+    'postgraduate': 'Postgraduate',
+    'pg': 'Postgraduate',
+    'master': 'Postgraduate',
+    'masters': 'Postgraduate',
+    'mtech': 'Postgraduate',
+    'me': 'Postgraduate',
+    'msc': 'Postgraduate',
+    'ma': 'Postgraduate',
+    'mcom': 'Postgraduate',
+    'mba': 'Postgraduate',
+    'phd': 'PhD',
+    'doctoral': 'PhD',
+    'doctorate': 'PhD',
+    'diploma': 'Diploma',
+    'certificate': 'Certificate'
+}
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text."""
@@ -40,17 +100,8 @@ def extract_keywords(text: str) -> List[str]:
     words = re.findall(r'\b[a-zA-Z]{3,}\b', text)
 
     # Remove common stop words
-    stop_words = {
-        'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-        'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before',
-        'after', 'above', 'below', 'between', 'among', 'this', 'that', 'these',
-        'those', 'is', 'are', 'was', 'were', 'been', 'being', 'have', 'has',
-        'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
-        'might', 'must', 'can', 'shall'
-    }
-
     keywords = [
-        word for word in words if word not in stop_words and len(word) > 2]
+        word for word in words if word not in _STOP_WORDS and len(word) > 2]
 
     # Remove duplicates while preserving order
     seen = set()
@@ -139,28 +190,7 @@ def normalize_category(category: str) -> str:
 
     category = category.lower().strip()
 
-    # Mapping of common variations to standard categories
-    category_mapping = {
-        'merit': 'Merit',
-        'merit-cum-means': 'Merit-cum-Means',
-        'merit cum means': 'Merit-cum-Means',
-        'means': 'Means',
-        'need based': 'Need-based',
-        'need-based': 'Need-based',
-        'sc': 'SC/ST',
-        'st': 'SC/ST',
-        'sc/st': 'SC/ST',
-        'obc': 'OBC',
-        'minority': 'Minority',
-        'central government': 'Central Government',
-        'state government': 'State Government',
-        'private': 'Private',
-        'research': 'Research',
-        'fellowship': 'Fellowship',
-        'international': 'International'
-    }
-
-    return category_mapping.get(category, category.title())
+    return _CATEGORY_MAPPING.get(category, category.title())
 
 
 def normalize_level(level: str) -> str:
@@ -170,34 +200,7 @@ def normalize_level(level: str) -> str:
 
     level = level.lower().strip()
 
-    level_mapping = {
-        'undergraduate': 'Undergraduate',
-        'ug': 'Undergraduate',
-        'bachelor': 'Undergraduate',
-        'bachelors': 'Undergraduate',
-        'btech': 'Undergraduate',
-        'be': 'Undergraduate',
-        'bsc': 'Undergraduate',
-        'ba': 'Undergraduate',
-        'bcom': 'Undergraduate',
-        'postgraduate': 'Postgraduate',
-        'pg': 'Postgraduate',
-        'master': 'Postgraduate',
-        'masters': 'Postgraduate',
-        'mtech': 'Postgraduate',
-        'me': 'Postgraduate',
-        'msc': 'Postgraduate',
-        'ma': 'Postgraduate',
-        'mcom': 'Postgraduate',
-        'mba': 'Postgraduate',
-        'phd': 'PhD',
-        'doctoral': 'PhD',
-        'doctorate': 'PhD',
-        'diploma': 'Diploma',
-        'certificate': 'Certificate'
-    }
-
-    return level_mapping.get(level, level.title())
+    return _LEVEL_MAPPING.get(level, level.title())
 
 
 def extract_amount_from_text(text: str) -> Optional[float]:
@@ -4,6 +4,7 @@ Celery configuration for background tasks.
 
 import os
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -27,8 +28,20 @@ app = Celery(
 
 # Celery configuration
 app.conf.update(
-    # Task routing
+    # Task routing. Tasks are split by workload class first so a discovery
+    # backlog on "ingest" cannot delay short beat ticks on "housekeeping" or
+    # user-facing mail on "interactive"; everything else falls through to
+    # the per-module queues.
     task_routes={
+        "app.tasks.scraping_tasks.discover_new_scholarship_sources": {"queue": "ingest"},
+        "app.tasks.scraping_tasks.scrape_discovered_source": {"queue": "ingest"},
+        "app.tasks.scraping_tasks.update_discovery_summary": {"queue": "housekeeping"},
+        "app.tasks.scraping_tasks.intelligent_discovery_scheduler": {"queue": "housekeeping"},
+        "app.tasks.scraping_tasks.validate_discovered_sources": {"queue": "housekeeping"},
+        "app.tasks.notification_tasks.send_bulk_notifications": {"queue": "ingest"},
+        "app.tasks.notification_tasks.send_deadline_reminders": {"queue": "housekeeping"},
+        "app.tasks.notification_tasks.cleanup_old_notifications": {"queue": "housekeeping"},
+        "app.tasks.notification_tasks.send_email_notification": {"queue": "interactive"},
         "app.tasks.scraping_tasks.*": {"queue": "scraping"},
         "app.tasks.notification_tasks.*": {"queue": "notifications"},
         "app.tasks.validation_tasks.*": {"queue": "validation"},
@@ -37,9 +50,11 @@ app.conf.update(
     },
 
     # Task serialization
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack is faster and more compact than JSON for the page/result
+    # payloads; JSON is still accepted for messages queued before the switch
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
     timezone="Asia/Kolkata",
     enable_utc=True,
 
@@ -47,6 +62,8 @@ app.conf.update(
     task_always_eager=False,
     worker_prefetch_multiplier=1,
     task_acks_late=True,
+    # Requeue, rather than drop, a late-acked task whose worker was killed
+    task_reject_on_worker_lost=True,
     worker_disable_rate_limits=False,
 
     # Task retry settings
@@ -83,7 +100,7 @@ app.conf.update(
         "send-deadline-reminders": {
             "task": "app.tasks.notification_tasks.send_deadline_reminders",
             "schedule": 86400.0,  # Daily
-            "options": {"queue": "notifications"}
+            "options": {"queue": "housekeeping"}
         },
         "cleanup-old-data": {
             "task": "app.tasks.cleanup_tasks.cleanup_old_data",
@@ -114,6 +131,27 @@ app.conf.update(
     database_url=os.getenv("DATABASE_URL")
 )
 
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Give each forked worker process its own DB pool and event loop."""
+    from app.core.database import init_worker_engine
+    from app.core.worker_runtime import get_loop
+    init_worker_engine()
+    get_loop()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """Close the worker's shared HTTP client, browser and event loop."""
+    from app.core.worker_runtime import run_async, shutdown
+    from app.services.validation_service import close_validation_service
+    try:
+        run_async(close_validation_service())
+    finally:
+        shutdown()
+
+
 # Task annotations for better monitoring
 app.conf.task_annotations = {
     "app.tasks.scraping_tasks.*": {
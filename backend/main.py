@@ -16,7 +16,7 @@ from app.models import models
 from app.core.logging import setup_logging
 from app.core.cache import redis_client
 from app.core.auth import get_current_user, get_current_admin
-from app.core.database import get_db, engine
+from app.core.database import get_db, engine, ensure_title_hash_column
 from app.core.config import settings
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
@@ -44,6 +44,7 @@ logger = logging.getLogger(__name__)
 
 # Create database tables
 models.Base.metadata.create_all(bind=engine)
+ensure_title_hash_column()
 
 
 @asynccontextmanager